@@ -11,12 +11,15 @@ from fastapi import Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 
 from app.auth import MockAuthenticationService
+from app.search_cache import SearchResultCache
 from domain.exceptions import UnauthorizedAccessError
-from infra.database import get_db_session
+from domain.search import SearchStrategy
+from infra.database import get_database_config, get_db_session, scope_session_to_user
 from infra.repositories import (
     SQLAlchemyUserRepository, SQLAlchemyStudyBookRepository, SQLAlchemyQuestionRepository,
     SQLAlchemyTypingLogRepository, SQLAlchemyLearningEventRepository
 )
+from infra.postgres_search import PostgresFtsStrategy
 from infra.sqlite_search import SQLiteFtsStrategy
 from app.config import settings
 
@@ -30,16 +33,24 @@ def get_auth_service(session: Session = Depends(get_db_session)) -> MockAuthenti
 
 def get_current_user_id(
     request: Request,
-    auth_service: MockAuthenticationService = Depends(get_auth_service)
+    auth_service: MockAuthenticationService = Depends(get_auth_service),
+    session: Session = Depends(get_db_session)
 ) -> UUID:
-    """Dependency to get current authenticated user ID."""
+    """Dependency to get current authenticated user ID.
+    
+    The request's database session is scoped to the user, so PostgreSQL
+    row-level security only exposes the user's own rows.
+    """
     try:
-        return auth_service.get_current_user_id(request)
+        user_id = auth_service.get_current_user_id(request)
     except UnauthorizedAccessError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e)
         )
+    
+    scope_session_to_user(session, user_id)
+    return user_id
 
 
 # Repository dependencies
@@ -69,8 +80,21 @@ def get_learning_event_repository(session: Session = Depends(get_db_session)) ->
 
 
 # Search dependencies
-def get_search_strategy() -> SQLiteFtsStrategy:
-    """Dependency to get search strategy."""
+search_cache = SearchResultCache(
+    maxsize=settings.search_cache_size,
+    ttl=settings.search_cache_ttl_seconds
+)
+
+
+def get_search_cache() -> SearchResultCache:
+    """Dependency to get the shared search result cache."""
+    return search_cache
+
+
+def get_search_strategy() -> SearchStrategy:
+    """Dependency to get the search strategy for the configured database."""
+    if settings.database_url.startswith("postgresql"):
+        return PostgresFtsStrategy(get_database_config().engine)
     return SQLiteFtsStrategy(settings.database_url)
 
 
@@ -9,7 +9,7 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.monitoring import performance_monitor, get_request_context
@@ -17,7 +17,7 @@ from app.logging_config import get_logger, log_with_context
 from domain.dtos import HealthCheckResponse, HealthCheckComponent
 from domain.exceptions import SearchIndexError
 from infra.database import get_database
-from infra.sqlite_search import SQLiteFtsStrategy
+from api.dependencies import get_search_strategy
 
 router = APIRouter(tags=["health"])
 logger = get_logger(__name__)
@@ -91,8 +91,8 @@ async def health_check(request: Request, database=Depends(get_database)):
             **context
         )
         
-        search_strategy = SQLiteFtsStrategy(settings.database_url)
-        # Test search with a dummy user ID - this will verify FTS5 table exists
+        search_strategy = get_search_strategy()
+        # Test search with a dummy user ID - this will verify the search index exists
         dummy_user_id = UUID("00000000-0000-0000-0000-000000000000")
         await search_strategy.search_questions("test", dummy_user_id, limit=1)
         health_status["checks"]["search"] = HealthCheckComponent(
@@ -158,7 +158,7 @@ async def health_check(request: Request, database=Depends(get_database)):
     response_model = HealthCheckResponse(**health_status)
     status_code = 200 if health_status["status"] == "healthy" else 503
     
-    return JSONResponse(
+    return ORJSONResponse(
         content=response_model.model_dump(mode='json'),
         status_code=status_code
     )
@@ -191,7 +191,7 @@ async def search_health_check():
         Search index functionality status
     """
     try:
-        search_strategy = SQLiteFtsStrategy(settings.database_url)
+        search_strategy = get_search_strategy()
         dummy_user_id = UUID("00000000-0000-0000-0000-000000000000")
         await search_strategy.search_questions("test", dummy_user_id, limit=1)
         return {"status": "ok", "timestamp": datetime.utcnow()}
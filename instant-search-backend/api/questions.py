@@ -10,7 +10,10 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
-from api.dependencies import get_current_user_id, get_question_repository, get_study_book_repository
+from api.dependencies import (
+    get_current_user_id, get_question_repository, get_search_cache, get_study_book_repository
+)
+from app.search_cache import SearchResultCache
 from domain.dtos import (
     QuestionCreateRequest, QuestionUpdateRequest, QuestionResponse, RandomQuestionResponse
 )
@@ -28,7 +31,8 @@ async def create_question(
     study_book_id: UUID = Query(..., description="ID of the study book to add the question to"),
     user_id: UUID = Depends(get_current_user_id),
     question_repo: SQLAlchemyQuestionRepository = Depends(get_question_repository),
-    study_book_repo: SQLAlchemyStudyBookRepository = Depends(get_study_book_repository)
+    study_book_repo: SQLAlchemyStudyBookRepository = Depends(get_study_book_repository),
+    search_cache: SearchResultCache = Depends(get_search_cache)
 ):
     """
     Create a new question in a study book for the authenticated user.
@@ -39,6 +43,7 @@ async def create_question(
         user_id: Current authenticated user ID
         question_repo: Question repository
         study_book_repo: StudyBook repository for ownership verification
+        search_cache: Search result cache to invalidate for the user
         
     Returns:
         Created Question data
@@ -67,6 +72,7 @@ async def create_question(
         
         # Save to repository
         created_question = await question_repo.create(question)
+        search_cache.invalidate_user(user_id)
         
         # Convert to response model
         return QuestionResponse(
@@ -88,6 +94,78 @@ async def create_question(
         )
 
 
+@router.post("/bulk", response_model=List[QuestionResponse], status_code=status.HTTP_201_CREATED)
+async def create_questions_bulk(
+    requests: List[QuestionCreateRequest],
+    study_book_id: UUID = Query(..., description="ID of the study book to add the questions to"),
+    user_id: UUID = Depends(get_current_user_id),
+    question_repo: SQLAlchemyQuestionRepository = Depends(get_question_repository),
+    study_book_repo: SQLAlchemyStudyBookRepository = Depends(get_study_book_repository),
+    search_cache: SearchResultCache = Depends(get_search_cache)
+):
+    """
+    Create several questions in a study book with a single insert.
+    
+    Args:
+        requests: Question creation data for each question
+        study_book_id: UUID of the study book to add the questions to
+        user_id: Current authenticated user ID
+        question_repo: Question repository
+        study_book_repo: StudyBook repository for ownership verification
+        search_cache: Search result cache to invalidate for the user
+        
+    Returns:
+        Created Question data, in request order
+        
+    Raises:
+        HTTPException: 400 for validation errors, 404 if study book not found
+    """
+    try:
+        # Verify study book exists and user owns it
+        study_book = await study_book_repo.get_by_id(study_book_id, user_id)
+        if not study_book:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Study book with ID {study_book_id} not found"
+            )
+        
+        questions = [
+            Question(
+                study_book_id=study_book_id,
+                language=request.language,
+                category=request.category,
+                difficulty=request.difficulty,
+                question=request.question,
+                answer=request.answer
+            )
+            for request in requests
+        ]
+        
+        created_questions = await question_repo.create_many(questions)
+        search_cache.invalidate_user(user_id)
+        
+        return [
+            QuestionResponse(
+                id=question.id,
+                study_book_id=question.study_book_id,
+                language=question.language,
+                category=question.category,
+                difficulty=question.difficulty,
+                question=question.question,
+                answer=question.answer,
+                created_at=question.created_at,
+                updated_at=question.updated_at
+            )
+            for question in created_questions
+        ]
+        
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.get("/", response_model=List[QuestionResponse])
 async def get_questions_by_study_book(
     study_book_id: UUID = Query(..., description="ID of the study book to get questions from"),
@@ -241,7 +319,8 @@ async def update_question(
     question_id: UUID,
     request: QuestionUpdateRequest,
     user_id: UUID = Depends(get_current_user_id),
-    question_repo: SQLAlchemyQuestionRepository = Depends(get_question_repository)
+    question_repo: SQLAlchemyQuestionRepository = Depends(get_question_repository),
+    search_cache: SearchResultCache = Depends(get_search_cache)
 ):
     """
     Update a question for the authenticated user.
@@ -251,6 +330,7 @@ async def update_question(
         request: Question update data
         user_id: Current authenticated user ID
         question_repo: Question repository
+        search_cache: Search result cache to invalidate for the user
         
     Returns:
         Updated Question data
@@ -282,6 +362,7 @@ async def update_question(
         
         # Save updated question
         updated_question = await question_repo.update(existing_question, user_id)
+        search_cache.invalidate_user(user_id)
         
         # Convert to response model
         return QuestionResponse(
@@ -312,7 +393,8 @@ async def update_question(
 async def delete_question(
     question_id: UUID,
     user_id: UUID = Depends(get_current_user_id),
-    question_repo: SQLAlchemyQuestionRepository = Depends(get_question_repository)
+    question_repo: SQLAlchemyQuestionRepository = Depends(get_question_repository),
+    search_cache: SearchResultCache = Depends(get_search_cache)
 ):
     """
     Delete a question for the authenticated user.
@@ -321,6 +403,7 @@ async def delete_question(
         question_id: UUID of the question to delete
         user_id: Current authenticated user ID
         question_repo: Question repository
+        search_cache: Search result cache to invalidate for the user
         
     Raises:
         HTTPException: 404 if not found
@@ -334,6 +417,8 @@ async def delete_question(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Question with ID {question_id} not found"
             )
+        
+        search_cache.invalidate_user(user_id)
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
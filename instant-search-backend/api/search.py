@@ -5,37 +5,79 @@ This module provides full-text search functionality for questions using the
 search strategy interface with proper user scoping and query parameter validation.
 """
 
+import base64
+import json
+from typing import Optional, Tuple
+
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from uuid import UUID
 
-from api.dependencies import get_current_user_id, get_search_strategy
+from api.dependencies import get_current_user_id, get_search_cache, get_search_strategy
+from app.search_cache import SearchResultCache
 from domain.dtos import SearchResponse
 from domain.exceptions import SearchIndexError, ValidationError
-from infra.sqlite_search import SQLiteFtsStrategy
+from domain.search import SearchStrategy
 
 
 router = APIRouter(prefix="/search", tags=["search"])
 
 
+def _encode_cursor(rank: float, question_id: UUID) -> str:
+    """Encode the position of a search result as an opaque page cursor."""
+    payload = json.dumps([rank, str(question_id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[float, UUID]:
+    """Decode a page cursor back into the (rank, question_id) it points after.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    # Decoding errors are ValueErrors already
+    payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    if (
+        not isinstance(payload, list)
+        or len(payload) != 2
+        or not isinstance(payload[0], (int, float))
+        or not isinstance(payload[1], str)
+    ):
+        raise ValueError("Cursor must be a [rank, question_id] pair")
+    rank, question_id = payload
+    return float(rank), UUID(question_id)
+
+
 @router.get("/questions", response_model=SearchResponse)
 async def search_questions(
-    q: str = Query(..., description="Search query string", min_length=1, max_length=200),
+    q: str = Query(
+        ...,
+        description="Search query string",
+        min_length=1,
+        max_length=200,
+        pattern=r"\S"
+    ),
     limit: int = Query(50, description="Maximum number of results to return", ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page of results"),
     user_id: UUID = Depends(get_current_user_id),
-    search_strategy: SQLiteFtsStrategy = Depends(get_search_strategy)
+    search_strategy: SearchStrategy = Depends(get_search_strategy),
+    search_cache: SearchResultCache = Depends(get_search_cache)
 ):
     """
     Search questions using full-text search for the authenticated user.
     
-    This endpoint searches through questions and answers using SQLite FTS5,
+    This endpoint searches through questions and answers using full-text search,
     returning results with relevance scores and highlighted matches.
     Results are scoped to questions in study books owned by the authenticated user.
+    When more results may follow, the response carries a next_cursor to pass
+    back for the next page.
     
     Args:
-        q: Search query string (1-200 characters)
+        q: Search query string (1-200 characters, not only whitespace)
         limit: Maximum number of results to return (1-100, default: 50)
+        cursor: Opaque cursor returned as next_cursor by the previous page
         user_id: Current authenticated user ID
         search_strategy: Search strategy implementation
+        search_cache: Cache of recent search results
         
     Returns:
         SearchResponse with query, results, and total count
@@ -43,30 +85,50 @@ async def search_questions(
     Raises:
         HTTPException: 400 for validation errors, 500 for search index errors
     """
-    try:
-        # Validate query parameters
-        if not q or not q.strip():
+    # Decode the cursor up front so a bad one is reported as a client error
+    after = None
+    if cursor:
+        try:
+            after = _decode_cursor(cursor)
+        except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Search query cannot be empty"
+                detail="Invalid search cursor"
             )
-        
+    
+    try:
+        # Empty, blank and over-long queries were already rejected by validation
         query = q.strip()
         
-        if len(query) > 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Search query cannot exceed 200 characters"
-            )
+        if after:
+            search_results = await search_strategy.search_questions(query, user_id, limit, after)
+        else:
+            # Serve repeated first pages from the cache until the user's questions change
+            # The key is taken before searching so a concurrent write isn't cached over
+            cache_key = search_cache.key(user_id, query, limit)
+            search_results = search_cache.get(cache_key)
+            if search_results is None:
+                search_results = await search_strategy.search_questions(query, user_id, limit)
+                search_cache.set(cache_key, search_results)
+        
+        # The total before the limit comes back on every row of the search query
+        if search_results and search_results[0].total_count is not None:
+            total_count = search_results[0].total_count
+        else:
+            total_count = len(search_results)
         
-        # Perform search using strategy interface
-        search_results = await search_strategy.search_questions(query, user_id, limit)
+        # A full page may be followed by more results
+        next_cursor = None
+        last_result = search_results[-1] if search_results else None
+        if len(search_results) == limit and last_result.rank is not None:
+            next_cursor = _encode_cursor(last_result.rank, last_result.question_id)
         
         # Return structured response
         return SearchResponse(
             query=query,
             results=search_results,
-            total_count=len(search_results)
+            total_count=total_count,
+            next_cursor=next_cursor
         )
         
     except ValidationError as e:
@@ -89,7 +151,7 @@ async def search_questions(
 @router.post("/rebuild-index", status_code=status.HTTP_204_NO_CONTENT)
 async def rebuild_search_index(
     user_id: UUID = Depends(get_current_user_id),
-    search_strategy: SQLiteFtsStrategy = Depends(get_search_strategy)
+    search_strategy: SearchStrategy = Depends(get_search_strategy)
 ):
     """
     Rebuild the search index.
@@ -10,8 +10,9 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from api.dependencies import get_current_user_id, get_study_book_repository
+from api.dependencies import get_current_user_id, get_search_cache, get_study_book_repository
 from api.utils import to_study_book_response, to_study_book_responses
+from app.search_cache import SearchResultCache
 from domain.dtos import (
     StudyBookCreateRequest, StudyBookUpdateRequest, StudyBookResponse
 )
@@ -203,7 +204,8 @@ async def update_study_book(
 async def delete_study_book(
     study_book_id: UUID,
     user_id: UUID = Depends(get_current_user_id),
-    study_book_repo: SQLAlchemyStudyBookRepository = Depends(get_study_book_repository)
+    study_book_repo: SQLAlchemyStudyBookRepository = Depends(get_study_book_repository),
+    search_cache: SearchResultCache = Depends(get_search_cache)
 ):
     """
     Delete a study book for the authenticated user.
@@ -212,6 +214,7 @@ async def delete_study_book(
         study_book_id: UUID of the study book to delete
         user_id: Current authenticated user ID
         study_book_repo: StudyBook repository
+        search_cache: Search result cache to invalidate for the user
         
     Raises:
         HTTPException: 404 if not found
@@ -223,4 +226,7 @@ async def delete_study_book(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Study book with ID {study_book_id} not found"
-        )
\ No newline at end of file
+        )
+    
+    # Deleting a study book deletes its questions
+    search_cache.invalidate_user(user_id)
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 from uuid import UUID
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, EmailStr
 
 from api.dependencies import get_current_user_id, get_auth_service
@@ -37,6 +38,15 @@ class UserResponse(BaseModel):
         )
 
 
+def _user_json_response(user: User) -> ORJSONResponse:
+    """Serialize a user straight to an ORJSON response.
+    
+    The UserResponse is already validated when it is built, so returning a
+    response skips FastAPI validating it a second time against response_model.
+    """
+    return ORJSONResponse(UserResponse.from_domain_model(user).model_dump(mode="json"))
+
+
 class UserCreateResponse(BaseModel):
     """Response model for user creation."""
     id: UUID
@@ -147,7 +157,7 @@ def get_current_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    return UserResponse.from_domain_model(user)
+    return _user_json_response(user)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -173,4 +183,4 @@ def get_user_by_id(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    return UserResponse.from_domain_model(user)
\ No newline at end of file
+    return _user_json_response(user)
\ No newline at end of file
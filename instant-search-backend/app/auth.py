@@ -1,6 +1,7 @@
 """Mock authentication service implementation for development."""
 
 import asyncio
+from functools import lru_cache
 from uuid import UUID, uuid4
 from datetime import datetime
 from fastapi import Request
@@ -12,6 +13,12 @@ from domain.repositories import UserRepository
 from domain.exceptions import UnauthorizedAccessError, ValidationError
 
 
+@lru_cache(maxsize=8192)
+def _parse_user_id(value: str) -> UUID:
+    """Parse an X-User-Id header value, caching the few ids seen per process."""
+    return UUID(value)
+
+
 class MockAuthenticationService(AuthenticationService):
     """Mock authentication service for development and testing.
     
@@ -45,7 +52,7 @@ class MockAuthenticationService(AuthenticationService):
         
         if user_id_header:
             try:
-                user_id = UUID(user_id_header)
+                user_id = _parse_user_id(user_id_header)
                 user = self._run_async(self.user_repository.get_by_id(user_id))
                 
                 if user:
@@ -7,8 +7,8 @@ that meets strict performance requirements:
 - System problems retrieval: <500ms
 """
 
-from typing import List, Dict, Optional
-from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
 import time
 import asyncio
 from app.system_problems_service import SystemProblemsService, create_default_problems_data
@@ -16,7 +16,7 @@ from domain.system_problems import SystemProblem
 
 
 class CachedSystemProblemsService(SystemProblemsService):
-    """Cached implementation for optimal performance using LRU cache.
+    """Cached implementation for optimal performance using in-memory snapshots.
     
     Performance targets:
     - Language list retrieval: <100ms
@@ -26,64 +26,74 @@ class CachedSystemProblemsService(SystemProblemsService):
     def __init__(self, cache_size: int = 128):
         """Initialize cached service with performance optimizations."""
         self._cache_size = cache_size
-        self._problems_cache: Optional[Dict[str, List[SystemProblem]]] = None
-        self._languages_cache: Optional[List[str]] = None
+        # Read-only view of immutable problem snapshots by language, built once
+        # per cache load
+        self._problems_cache: Optional[Mapping[str, Tuple[SystemProblem, ...]]] = None
+        # Immutable snapshot of the language list, built once per cache load
+        self._languages_cache: Optional[Tuple[str, ...]] = None
         self._cache_timestamp: Optional[float] = None
         self._cache_lock = asyncio.Lock()
+        # Problem lookups for languages that are / are not in the cache
+        self._hits = 0
+        self._misses = 0
 
     async def get_problems_by_language(self, language: str) -> List[SystemProblem]:
-        """Get problems for specific language with caching."""
-        await self._ensure_cache_loaded()
-        normalized_lang = self.normalize_language(language)
-        return self._get_problems_by_language_cached(normalized_lang)
+        """Get problems for specific language with caching.
+        
+        Once loaded a hit is a single dict lookup, without awaiting anything;
+        callers get their own list, so the snapshot itself can never be modified.
+        """
+        if self._problems_cache is None:
+            await self._ensure_cache_loaded()
+        
+        problems = self._problems_cache.get(self.normalize_language(language))
+        if problems is None:
+            self._misses += 1
+            return []
+        self._hits += 1
+        return list(problems)
 
     async def get_available_languages(self) -> List[str]:
-        """Get list of available languages with caching."""
-        await self._ensure_cache_loaded()
-        return self._get_available_languages_cached()
+        """Get list of available languages from the cached snapshot.
+        
+        Once loaded this awaits nothing and does no cache key lookup; callers
+        get their own list, so the snapshot itself can never be modified.
+        """
+        if self._languages_cache is None:
+            await self._ensure_cache_loaded()
+        return list(self._languages_cache)
 
     async def _ensure_cache_loaded(self):
-        """Ensure cache is loaded with thread safety."""
+        """Ensure cache is loaded with thread safety.
+        
+        Concurrent callers on a cold cache wait on the lock and find the cache
+        loaded, so all languages are loaded exactly once.
+        """
         if self._problems_cache is None or self._languages_cache is None:
             async with self._cache_lock:
                 if self._problems_cache is None or self._languages_cache is None:
                     await self._load_cache_async()
 
-    @lru_cache(maxsize=128)
-    def _get_problems_by_language_cached(self, normalized_language: str) -> List[SystemProblem]:
-        """LRU cached implementation of get_problems_by_language."""
-        return self._problems_cache.get(normalized_language, [])
-
-    @lru_cache(maxsize=1)
-    def _get_available_languages_cached(self) -> List[str]:
-        """LRU cached implementation of get_available_languages."""
-        return self._languages_cache.copy()
-
     async def _load_cache_async(self):
         """Load both problems and languages cache asynchronously."""
-        self._problems_cache = create_default_problems_data()
-        self._languages_cache = list(self._problems_cache.keys())
+        problems = create_default_problems_data()
+        self._problems_cache = MappingProxyType(
+            {language: tuple(language_problems) for language, language_problems in problems.items()}
+        )
+        self._languages_cache = tuple(problems)
         self._cache_timestamp = time.time()
 
     def get_cache_info(self) -> Dict[str, any]:
         """Get cache statistics for monitoring and performance analysis."""
-        info = {
+        return {
             "cache_size": self._cache_size,
             "problems_cached": len(self._problems_cache) if self._problems_cache else 0,
             "languages_cached": len(self._languages_cache) if self._languages_cache else 0,
             "cache_timestamp": self._cache_timestamp,
             "cache_age_seconds": time.time() - self._cache_timestamp if self._cache_timestamp else None,
+            "hits": self._hits,
+            "misses": self._misses,
         }
-        
-        # Add LRU cache statistics
-        try:
-            info["lru_problems_cache"] = self._get_problems_by_language_cached.cache_info()._asdict()
-            info["lru_languages_cache"] = self._get_available_languages_cached.cache_info()._asdict()
-        except AttributeError:
-            info["lru_problems_cache"] = {"hits": 0, "misses": 0, "maxsize": self._cache_size, "currsize": 0}
-            info["lru_languages_cache"] = {"hits": 0, "misses": 0, "maxsize": 1, "currsize": 0}
-            
-        return info
 
     async def clear_cache(self):
         """Clear all caches for testing or cache invalidation."""
@@ -91,18 +101,9 @@ class CachedSystemProblemsService(SystemProblemsService):
             self._problems_cache = None
             self._languages_cache = None
             self._cache_timestamp = None
-            self._get_problems_by_language_cached.cache_clear()
-            self._get_available_languages_cached.cache_clear()
+            self._hits = 0
+            self._misses = 0
 
     async def warm_cache(self):
         """Pre-warm the cache for optimal performance."""
-        await self._ensure_cache_loaded()
-        
-        # Pre-populate LRU cache with common languages
-        common_languages = ["javascript", "html", "css", "python3", "sql"]
-        for lang in common_languages:
-            if lang in self._problems_cache:
-                self._get_problems_by_language_cached(lang)
-        
-        # Pre-populate languages cache
-        self._get_available_languages_cached()
\ No newline at end of file
+        await self._ensure_cache_loaded()
\ No newline at end of file
@@ -9,7 +9,7 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.logging_config import get_logger
 from app.middleware import get_trace_id
@@ -38,7 +38,7 @@ class CompatibilityErrorHandler:
         error: Exception,
         service_name: str,
         operation: str
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle service errors with frontend-compatible format."""
         trace_id = get_trace_id(request)
         user_id = getattr(request.state, "user_id", None)
@@ -59,7 +59,7 @@ class CompatibilityErrorHandler:
             exc_info=True
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "ServiceError",
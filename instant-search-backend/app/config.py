@@ -19,6 +19,13 @@ class Settings(BaseSettings):
     
     # Database settings
     database_url: str = "sqlite:///./data/app.db"
+    database_pool_size: int = 20
+    database_max_overflow: int = 10
+    database_pool_timeout: int = 30
+    
+    # Search settings
+    search_cache_size: int = 10000
+    search_cache_ttl_seconds: int = 60
     
     # Logging settings
     log_level: str = "INFO"
@@ -0,0 +1,76 @@
+"""
+In-process cache for search results.
+
+Search results are a pure function of (user_id, query, limit) between writes
+to that user's questions, so repeated searches are answered from memory.
+Entries expire after a short TTL and are invalidated per user whenever the
+user's questions change.
+"""
+
+from itertools import count
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from domain.dtos import SearchResult
+
+
+class SearchResultCache:
+    """LRU cache with TTL expiry for search results.
+
+    Each user has a generation that is part of every cache key. Invalidating
+    a user drops their generation, so their old entries are never read again
+    and simply age out of the LRU. Generations are drawn from one counter and
+    never reused, so generations that expire or are evicted only cause misses.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 60):
+        """Initialize the search result cache.
+
+        Args:
+            maxsize: Maximum number of cached searches
+            ttl: Seconds a cached search stays valid
+        """
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._next_generation = count()
+
+    def key(self, user_id: UUID, query: str, limit: int) -> Tuple[Hashable, ...]:
+        """Build the cache key for a search.
+
+        Take the key before running the search and store the results under
+        it, so a write that invalidates the user while the search runs is
+        not cached over.
+        """
+        generation = self._generations.get(user_id)
+        if generation is None:
+            generation = self._generations[user_id] = next(self._next_generation)
+        return (user_id, generation, query.lower(), limit)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[List[SearchResult]]:
+        """Get cached results for a search key, or None on a miss."""
+        return self._cache.get(key)
+
+    def set(self, key: Tuple[Hashable, ...], results: List[SearchResult]) -> None:
+        """Cache the results of a search, unless its user was invalidated since."""
+        user_id, generation = key[0], key[1]
+        if self._generations.get(user_id) == generation:
+            self._cache[key] = results
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Invalidate every cached search for a user."""
+        self._generations.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached searches."""
+        self._cache.clear()
+        self._generations.clear()
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        return {
+            "maxsize": self._cache.maxsize,
+            "ttl": self._cache.ttl,
+            "currsize": self._cache.currsize,
+        }
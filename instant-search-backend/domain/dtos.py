@@ -160,6 +160,10 @@ class SearchResult(BaseModel):
     answer: str
     highlight: str
     score: float
+    # Number of matches before the limit, read from the search query itself
+    total_count: Optional[int] = Field(None, exclude=True)
+    # Backend ranking value the results are ordered by, for keyset pagination
+    rank: Optional[float] = Field(None, exclude=True)
 
 
 class SearchResponse(BaseModel):
@@ -168,6 +172,7 @@ class SearchResponse(BaseModel):
     query: str
     results: List[SearchResult]
     total_count: int
+    next_cursor: Optional[str] = None
 
 
 # Pagination DTOs
@@ -200,6 +200,22 @@ class QuestionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def create_many(self, questions: List[Question]) -> List[Question]:
+        """
+        Create several questions in a single write.
+        
+        Args:
+            questions: Question entities to create
+            
+        Returns:
+            Created question entities, in the order given
+            
+        Raises:
+            DomainException: If question creation fails
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, question_id: UUID, user_id: UUID) -> Optional[Question]:
         """
@@ -6,7 +6,7 @@ full-text search functionality with different backends (SQLite FTS5, PostgreSQL,
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from .dtos import SearchResult
@@ -24,7 +24,8 @@ class SearchStrategy(ABC):
         self, 
         query: str, 
         user_id: UUID, 
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[float, UUID]] = None
     ) -> List[SearchResult]:
         """Search questions using full-text search.
         
@@ -32,6 +33,8 @@ class SearchStrategy(ABC):
             query: The search query string
             user_id: User ID to scope the search to user's questions only
             limit: Maximum number of results to return (default: 50)
+            after: (rank, question_id) of the last result of the previous
+                page; only results ordered after it are returned
             
         Returns:
             List of SearchResult objects ordered by relevance score
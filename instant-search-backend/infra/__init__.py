@@ -6,6 +6,7 @@ for databases, search engines, and external services.
 """
 
 from .sqlite_search import SQLiteFtsStrategy
+from .postgres_search import PostgresFtsStrategy
 from .database import (
     Base,
     UserModel,
@@ -29,6 +30,7 @@ from .repositories import (
 
 __all__ = [
     'SQLiteFtsStrategy',
+    'PostgresFtsStrategy',
     "Base",
     "UserModel",
     "StudyBookModel", 
@@ -0,0 +1,30 @@
+"""
+Helpers for running blocking database work from async code.
+
+The repositories and search strategies expose async methods but talk to the
+database through synchronous drivers. Running those calls in a worker thread
+keeps them from blocking the event loop while the query is in flight.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, TypeVar
+
+
+T = TypeVar("T")
+
+
+def run_in_thread(method: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Turn a blocking method into an async one that runs in a worker thread.
+    
+    Args:
+        method: Synchronous function or method performing blocking I/O
+        
+    Returns:
+        Coroutine function with the same signature
+    """
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await asyncio.to_thread(method, *args, **kwargs)
+    
+    return wrapper
\ No newline at end of file
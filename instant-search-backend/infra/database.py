@@ -11,10 +11,10 @@ from uuid import uuid4
 
 from sqlalchemy import (
     Column, String, Text, Integer, Float, DateTime, ForeignKey,
-    Index, event, create_engine
+    Index, event, create_engine, text
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import Session, relationship, sessionmaker
 from databases import Database
 
 Base = declarative_base()
@@ -77,8 +77,14 @@ class QuestionModel(Base):
     typing_logs = relationship("TypingLogModel", back_populates="question")
 
 
-# Index for study_book_id lookup
-Index('idx_questions_study_book_id', QuestionModel.study_book_id)
+# Index for listing a study book's questions by creation time; on PostgreSQL it
+# also covers the question text so the listing can be an index-only scan
+Index(
+    'idx_questions_study_book_created',
+    QuestionModel.study_book_id,
+    QuestionModel.created_at.desc(),
+    postgresql_include=['question', 'answer']
+)
 
 
 class TypingLogModel(Base):
@@ -127,14 +133,32 @@ Index('idx_learning_events_user_occurred', LearningEventModel.user_id, LearningE
 class DatabaseConfig:
     """Database configuration and connection management."""
     
-    def __init__(self, database_url: str = "sqlite:///./app.db"):
+    def __init__(
+        self,
+        database_url: str = "sqlite:///./app.db",
+        pool_size: int = 20,
+        max_overflow: int = 10,
+        pool_timeout: int = 30
+    ):
         self.database_url = database_url
         self.database = Database(database_url)
         
         # Create engine for SQLAlchemy operations
+        engine_options = {}
+        if "sqlite" not in database_url:
+            # Keep warm connections to server databases and reuse them across
+            # requests; pre-ping replaces connections the server has dropped
+            engine_options.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_pre_ping=True
+            )
+        
         self.engine = create_engine(
             database_url,
-            connect_args={"check_same_thread": False} if "sqlite" in database_url else {}
+            connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
+            **engine_options
         )
         
         # Create session factory
@@ -170,7 +194,7 @@ def get_database_config() -> DatabaseConfig:
     global _database_config
     if _database_config is None:
         from app.config import settings
-        _database_config = DatabaseConfig(settings.database_url)
+        _database_config = _create_database_config(settings.database_url)
     return _database_config
 
 
@@ -180,10 +204,21 @@ def init_database(database_url: Optional[str] = None) -> DatabaseConfig:
     if database_url is None:
         from app.config import settings
         database_url = settings.database_url
-    _database_config = DatabaseConfig(database_url)
+    _database_config = _create_database_config(database_url)
     return _database_config
 
 
+def _create_database_config(database_url: str) -> DatabaseConfig:
+    """Create a database configuration using the pool settings."""
+    from app.config import settings
+    return DatabaseConfig(
+        database_url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout
+    )
+
+
 # Dependency injection for FastAPI
 def get_database():
     """FastAPI dependency to get database connection."""
@@ -200,6 +235,38 @@ def get_db_session():
         session.close()
 
 
+# PostgreSQL setting the row-level security policies compare owners against
+USER_SCOPE_SETTING = "app.user_id"
+
+
+def set_user_scope(connection, user_id) -> None:
+    """Scope PostgreSQL row-level security to a user for the current transaction."""
+    connection.execute(
+        text("SELECT set_config(:setting, :user_id, true)"),
+        {"setting": USER_SCOPE_SETTING, "user_id": str(user_id)}
+    )
+
+
+def scope_session_to_user(session: Session, user_id) -> None:
+    """Scope a session's transactions to a user's rows under row-level security.
+    
+    The scope is applied to the transaction already in progress, if any, and
+    to every transaction the session begins afterwards.
+    """
+    session.info["user_id"] = user_id
+    if session.bind.dialect.name == "postgresql" and session.in_transaction():
+        set_user_scope(session.connection(), user_id)
+
+
+# Event listener for row-level security scoping
+@event.listens_for(Session, 'after_begin')
+def apply_user_scope(session, transaction, connection):
+    """Apply the session's user scope to each new PostgreSQL transaction."""
+    user_id = session.info.get("user_id")
+    if user_id is not None and connection.dialect.name == "postgresql":
+        set_user_scope(connection, user_id)
+
+
 # Event listeners for automatic timestamp updates
 @event.listens_for(UserModel, 'before_update')
 def update_user_timestamp(mapper, connection, target):
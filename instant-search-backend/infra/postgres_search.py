@@ -0,0 +1,221 @@
+"""
+PostgreSQL full-text search strategy implementation.
+
+This module implements the SearchStrategy interface using PostgreSQL's
+tsvector/tsquery full-text search backed by a GIN index for production
+deployments.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from domain.search import SearchStrategy
+from domain.dtos import SearchResult
+from domain.exceptions import SearchIndexError, ValidationError
+from infra.concurrency import run_in_thread
+from infra.database import set_user_scope
+
+
+# Queries shorter than this skip full-text matching and use substring matching
+MIN_FULLTEXT_QUERY_LENGTH = 3
+
+# ts_rank_cd normalization flag 32 scales each rank to rank / (rank + 1), so
+# scores are already in [0, 1) and comparable across queries
+RANK_NORMALIZATION = 32
+
+# ts_headline options: a short fragment around the matched terms, marked the
+# same way as the SQLite snippet() highlights
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=20, MinWords=5, ShortWord=3"
+
+# Substring matching backed by the pg_trgm GIN indexes, ranked by similarity.
+# The first occurrence of the query in the question is marked in SQL with a
+# single linear strpos scan, the same way ts_headline marks full-text matches.
+_SUBSTRING_MATCH = """
+    SELECT
+        q.id as question_id,
+        q.question,
+        q.answer,
+        CASE WHEN hit.pos > 0 THEN
+            overlay(q.question PLACING
+                    '<mark>' || substr(q.question, hit.pos, char_length(:query)) || '</mark>'
+                    FROM hit.pos FOR char_length(:query))
+        ELSE q.question END as highlight,
+        similarity(lower(q.question), lower(:query)) as score,
+        COUNT(*) OVER () as total_count
+    FROM questions q
+    JOIN study_books sb ON sb.id = q.study_book_id
+    CROSS JOIN LATERAL (SELECT strpos(lower(q.question), lower(:query)) AS pos) hit
+    WHERE (lower(q.question) LIKE :pattern OR lower(q.answer) LIKE :pattern)
+    AND sb.user_id = :user_id
+"""
+
+# Keyset pagination over a set of matches: pages after the first start past
+# the (score, question_id) of the previous page's last row. Window counts in
+# the matches are taken before this filter, so total_count covers every page.
+_PAGE = """
+    SELECT * FROM ({matches}) matches
+    WHERE CAST(:after_rank AS float8) IS NULL
+    OR (score, question_id) < (CAST(:after_rank AS float8), CAST(:after_id AS text))
+    ORDER BY score DESC, question_id DESC
+    LIMIT :limit
+"""
+
+SUBSTRING_SEARCH_SQL = text(_PAGE.format(matches=_SUBSTRING_MATCH))
+
+# Full-text matching on the GIN-indexed search_vec column. When the query has
+# no searchable terms (only stopwords, for example) plainto_tsquery is empty
+# and the substring branch answers instead, in the same round trip. Only one
+# branch returns rows, so each branch's COUNT(*) OVER () is the total.
+_FULLTEXT_MATCH = """
+    WITH search AS (SELECT plainto_tsquery('english', :query) AS tsq)
+    SELECT
+        q.id as question_id,
+        q.question,
+        q.answer,
+        ts_headline('english', q.question || ' ' || q.answer, search.tsq,
+                    :headline_options) as highlight,
+        ts_rank_cd(q.search_vec, search.tsq, :rank_normalization) as score,
+        COUNT(*) OVER () as total_count
+    FROM questions q
+    JOIN study_books sb ON sb.id = q.study_book_id
+    CROSS JOIN search
+    WHERE numnode(search.tsq) > 0
+    AND q.search_vec @@ search.tsq
+    AND sb.user_id = :user_id
+    UNION ALL
+""" + _SUBSTRING_MATCH + """
+    AND (SELECT numnode(tsq) FROM search) = 0
+"""
+
+FULLTEXT_SEARCH_SQL = text(_PAGE.format(matches=_FULLTEXT_MATCH))
+
+
+@lru_cache(maxsize=2048)
+def _prepare_like_pattern(query: str) -> str:
+    """Build a lowercase LIKE pattern matching the query as a substring.
+
+    Memoized, since the same few queries are searched over and over.
+
+    Args:
+        query: Raw search query from user
+
+    Returns:
+        LIKE pattern with wildcard characters in the query escaped
+    """
+    escaped = query.strip().lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+class PostgresFtsStrategy(SearchStrategy):
+    """PostgreSQL full-text implementation of the search strategy interface.
+
+    Questions carry a generated ``search_vec`` tsvector column indexed with
+    GIN, so matching is an index lookup instead of a scan of every question.
+    Question text is weighted above answer text, so matches in the question
+    rank higher. Results are ranked with ``ts_rank_cd`` and highlighted with
+    ``ts_headline`` in the same query. Short queries and queries without
+    searchable terms fall back to substring matching on the pg_trgm indexes.
+    """
+
+    def __init__(self, engine: Engine):
+        """Initialize the PostgreSQL search strategy.
+
+        Args:
+            engine: SQLAlchemy engine connected to the PostgreSQL database
+        """
+        self.engine = engine
+
+    @run_in_thread
+    def search_questions(
+        self,
+        query: str,
+        user_id: UUID,
+        limit: int = 50,
+        after: Optional[Tuple[float, UUID]] = None
+    ) -> List[SearchResult]:
+        """Search questions using PostgreSQL full-text search.
+
+        Args:
+            query: The search query string
+            user_id: User ID to scope the search to user's questions only
+            limit: Maximum number of results to return (default: 50)
+            after: (rank, question_id) of the last result of the previous page
+
+        Returns:
+            List of SearchResult objects ordered by relevance score
+
+        Raises:
+            SearchIndexError: If search index is unavailable or corrupted
+            ValidationError: If query parameters are invalid
+        """
+        if not query or not query.strip():
+            raise ValidationError("Search query cannot be empty")
+
+        if limit <= 0 or limit > 100:
+            raise ValidationError("Limit must be between 1 and 100")
+
+        after_rank, after_id = after if after else (None, None)
+
+        try:
+            with self.engine.begin() as conn:
+                # Row-level security only exposes the user's own questions
+                set_user_scope(conn, user_id)
+
+                params = {
+                    "query": query.strip(),
+                    "pattern": _prepare_like_pattern(query),
+                    "user_id": str(user_id),
+                    "limit": limit,
+                    "after_rank": after_rank,
+                    "after_id": str(after_id) if after_id else None,
+                    "headline_options": HEADLINE_OPTIONS,
+                    "rank_normalization": RANK_NORMALIZATION,
+                }
+                if len(query.strip()) < MIN_FULLTEXT_QUERY_LENGTH:
+                    search_sql = SUBSTRING_SEARCH_SQL
+                else:
+                    search_sql = FULLTEXT_SEARCH_SQL
+
+                rows = conn.execute(search_sql, params).mappings().all()
+
+                return [
+                    SearchResult(
+                        question_id=UUID(row['question_id']),
+                        question=row['question'],
+                        answer=row['answer'],
+                        highlight=row['highlight'] or row['question'],
+                        score=min(1.0, max(0.0, row['score'])),
+                        total_count=row['total_count'],
+                        rank=row['score']
+                    )
+                    for row in rows
+                ]
+
+        except SQLAlchemyError as e:
+            raise SearchIndexError(f"PostgreSQL search error: {str(e)}")
+        except Exception as e:
+            raise SearchIndexError(f"Unexpected search error: {str(e)}")
+
+    @run_in_thread
+    def rebuild_index(self) -> None:
+        """Rebuild the GIN search index.
+
+        The ``search_vec`` column is generated by PostgreSQL and always up to
+        date, so only the index itself needs rebuilding.
+
+        Raises:
+            SearchIndexError: If index rebuild fails
+        """
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text("REINDEX INDEX questions_search_gin"))
+
+        except SQLAlchemyError as e:
+            raise SearchIndexError(f"Failed to rebuild search index: {str(e)}")
+        except Exception as e:
+            raise SearchIndexError(f"Unexpected error rebuilding index: {str(e)}")
\ No newline at end of file
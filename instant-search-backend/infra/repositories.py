@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, and_, desc, text
+from sqlalchemy import func, and_, desc, insert, text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -23,6 +23,7 @@ from domain.exceptions import (
     UserNotFoundError, StudyBookNotFoundError, QuestionNotFoundError,
     ValidationError
 )
+from .concurrency import run_in_thread
 from .database import (
     UserModel, StudyBookModel, QuestionModel, 
     TypingLogModel, LearningEventModel
@@ -138,7 +139,8 @@ class SQLAlchemyStudyBookRepository(StudyBookRepository):
     def __init__(self, session: Session):
         self.session = session
     
-    async def create(self, study_book: StudyBook) -> StudyBook:
+    @run_in_thread
+    def create(self, study_book: StudyBook) -> StudyBook:
         """Create a new study book."""
         try:
             db_study_book = StudyBookModel(
@@ -160,7 +162,8 @@ class SQLAlchemyStudyBookRepository(StudyBookRepository):
             self.session.rollback()
             raise ValidationError(f"Failed to create study book: {str(e)}")
     
-    async def get_by_id(self, study_book_id: UUID, user_id: UUID) -> Optional[StudyBook]:
+    @run_in_thread
+    def get_by_id(self, study_book_id: UUID, user_id: UUID) -> Optional[StudyBook]:
         """Get study book by ID, scoped to user."""
         try:
             db_study_book = self.session.query(StudyBookModel).filter(
@@ -175,7 +178,8 @@ class SQLAlchemyStudyBookRepository(StudyBookRepository):
         except SQLAlchemyError as e:
             raise ValidationError(f"Failed to get study book: {str(e)}")
     
-    async def get_by_user_id(self, user_id: UUID, limit: Optional[int] = None, offset: Optional[int] = None) -> List[StudyBook]:
+    @run_in_thread
+    def get_by_user_id(self, user_id: UUID, limit: Optional[int] = None, offset: Optional[int] = None) -> List[StudyBook]:
         """Get all study books for a user."""
         try:
             query = self.session.query(StudyBookModel).filter(
@@ -193,7 +197,8 @@ class SQLAlchemyStudyBookRepository(StudyBookRepository):
         except SQLAlchemyError as e:
             raise ValidationError(f"Failed to get study books: {str(e)}")
     
-    async def update(self, study_book: StudyBook) -> StudyBook:
+    @run_in_thread
+    def update(self, study_book: StudyBook) -> StudyBook:
         """Update an existing study book."""
         try:
             db_study_book = self.session.query(StudyBookModel).filter(
@@ -210,16 +215,18 @@ class SQLAlchemyStudyBookRepository(StudyBookRepository):
             db_study_book.description = study_book.description
             db_study_book.updated_at = datetime.utcnow().isoformat() + 'Z'
             
+            # Build the result before commit expires the instance
+            updated_study_book = self._to_domain_model(db_study_book)
             self.session.commit()
-            self.session.refresh(db_study_book)
             
-            return self._to_domain_model(db_study_book)
+            return updated_study_book
             
         except SQLAlchemyError as e:
             self.session.rollback()
             raise ValidationError(f"Failed to update study book: {str(e)}")
     
-    async def delete(self, study_book_id: UUID, user_id: UUID) -> bool:
+    @run_in_thread
+    def delete(self, study_book_id: UUID, user_id: UUID) -> bool:
         """Delete a study book by ID, scoped to user."""
         try:
             result = self.session.query(StudyBookModel).filter(
@@ -236,7 +243,8 @@ class SQLAlchemyStudyBookRepository(StudyBookRepository):
             self.session.rollback()
             raise ValidationError(f"Failed to delete study book: {str(e)}")
     
-    async def count_by_user_id(self, user_id: UUID) -> int:
+    @run_in_thread
+    def count_by_user_id(self, user_id: UUID) -> int:
         """Count study books for a user."""
         try:
             return self.session.query(StudyBookModel).filter(
@@ -264,7 +272,8 @@ class SQLAlchemyQuestionRepository(QuestionRepository):
     def __init__(self, session: Session):
         self.session = session
     
-    async def create(self, question: Question) -> Question:
+    @run_in_thread
+    def create(self, question: Question) -> Question:
         """Create a new question."""
         try:
             db_question = QuestionModel(
@@ -289,7 +298,39 @@ class SQLAlchemyQuestionRepository(QuestionRepository):
             self.session.rollback()
             raise ValidationError(f"Failed to create question: {str(e)}")
     
-    async def get_by_id(self, question_id: UUID, user_id: UUID) -> Optional[Question]:
+    @run_in_thread
+    def create_many(self, questions: List[Question]) -> List[Question]:
+        """Create several questions with one multi-row INSERT."""
+        if not questions:
+            return []
+        
+        try:
+            rows = [
+                {
+                    "id": str(question.id),
+                    "study_book_id": str(question.study_book_id),
+                    "language": question.language,
+                    "category": question.category,
+                    "difficulty": question.difficulty,
+                    "question": question.question,
+                    "answer": question.answer,
+                    "created_at": question.created_at.isoformat() + 'Z',
+                    "updated_at": question.updated_at.isoformat() + 'Z'
+                }
+                for question in questions
+            ]
+            
+            self.session.execute(insert(QuestionModel.__table__), rows)
+            self.session.commit()
+            
+            return questions
+            
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            raise ValidationError(f"Failed to create questions: {str(e)}")
+    
+    @run_in_thread
+    def get_by_id(self, question_id: UUID, user_id: UUID) -> Optional[Question]:
         """Get question by ID, scoped to user through study book ownership."""
         try:
             db_question = self.session.query(QuestionModel).join(
@@ -306,7 +347,8 @@ class SQLAlchemyQuestionRepository(QuestionRepository):
         except SQLAlchemyError as e:
             raise ValidationError(f"Failed to get question: {str(e)}")
     
-    async def get_by_study_book_id(self, study_book_id: UUID, user_id: UUID, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Question]:
+    @run_in_thread
+    def get_by_study_book_id(self, study_book_id: UUID, user_id: UUID, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Question]:
         """Get all questions for a study book, scoped to user."""
         try:
             query = self.session.query(QuestionModel).join(
@@ -329,7 +371,8 @@ class SQLAlchemyQuestionRepository(QuestionRepository):
         except SQLAlchemyError as e:
             raise ValidationError(f"Failed to get questions: {str(e)}")
     
-    async def get_random_by_study_book_id(self, study_book_id: UUID, user_id: UUID) -> Optional[Question]:
+    @run_in_thread
+    def get_random_by_study_book_id(self, study_book_id: UUID, user_id: UUID) -> Optional[Question]:
         """Get a random question from a study book, scoped to user."""
         try:
             db_question = self.session.query(QuestionModel).join(
@@ -346,9 +389,12 @@ class SQLAlchemyQuestionRepository(QuestionRepository):
         except SQLAlchemyError as e:
             raise ValidationError(f"Failed to get random question: {str(e)}")
     
-    async def update(self, question: Question, user_id: UUID) -> Question:
+    @run_in_thread
+    def update(self, question: Question, user_id: UUID) -> Question:
         """Update an existing question."""
         try:
+            # One query loads the question and checks ownership through its
+            # study book, without loading the study book itself
             db_question = self.session.query(QuestionModel).join(
                 StudyBookModel, QuestionModel.study_book_id == StudyBookModel.id
             ).filter(
@@ -368,16 +414,18 @@ class SQLAlchemyQuestionRepository(QuestionRepository):
             db_question.answer = question.answer
             db_question.updated_at = datetime.utcnow().isoformat() + 'Z'
             
+            # Build the result before commit expires the instance
+            updated_question = self._to_domain_model(db_question)
             self.session.commit()
-            self.session.refresh(db_question)
             
-            return self._to_domain_model(db_question)
+            return updated_question
             
         except SQLAlchemyError as e:
             self.session.rollback()
             raise ValidationError(f"Failed to update question: {str(e)}")
     
-    async def delete(self, question_id: UUID, user_id: UUID) -> bool:
+    @run_in_thread
+    def delete(self, question_id: UUID, user_id: UUID) -> bool:
         """Delete a question by ID, scoped to user."""
         try:
             # First verify the question exists and user owns it
@@ -433,7 +481,8 @@ class SQLAlchemyQuestionRepository(QuestionRepository):
             # Use a generic exception instead of ValidationError
             raise Exception(f"Failed to delete question: {str(e)}")
     
-    async def count_by_study_book_id(self, study_book_id: UUID, user_id: UUID) -> int:
+    @run_in_thread
+    def count_by_study_book_id(self, study_book_id: UUID, user_id: UUID) -> int:
         """Count questions in a study book, scoped to user."""
         try:
             return self.session.query(QuestionModel).join(
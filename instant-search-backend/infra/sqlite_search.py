@@ -6,12 +6,117 @@ full-text search capabilities for development and testing environments.
 """
 
 import sqlite3
-from typing import List
+import threading
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from domain.search import SearchStrategy
 from domain.dtos import SearchResult
 from domain.exceptions import SearchIndexError, ValidationError
+from infra.concurrency import run_in_thread
+
+
+# Prepared statements kept per connection; searches reuse the same few
+STATEMENT_CACHE_SIZE = 256
+
+# FTS5 auxiliary functions can't share a SELECT with a window function, so
+# the total is counted over the matches subquery. Pages after the first start
+# past the (score, question_id) of the previous page's last row.
+SEARCH_SQL = """
+SELECT * FROM (
+    SELECT *, COUNT(*) OVER () as total_count
+    FROM (
+        SELECT 
+            q.id as question_id,
+            q.question,
+            q.answer,
+            snippet(questions_fts, 1, '<mark>', '</mark>', '...', 32) as highlight,
+            bm25(questions_fts) as score
+        FROM questions_fts 
+        JOIN questions q ON q.id = questions_fts.question_id
+        JOIN study_books sb ON sb.id = q.study_book_id
+        WHERE questions_fts MATCH :query 
+        AND sb.user_id = :user_id
+    )
+)
+WHERE :after_rank IS NULL OR (score, question_id) > (:after_rank, :after_id)
+ORDER BY score ASC, question_id ASC
+LIMIT :limit
+"""
+
+# FTS5 index over question text, kept in step with the questions table by
+# triggers. It stores its own copy of the question id the searches join on.
+SEARCH_INDEX_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5(
+        question_id UNINDEXED,
+        question,
+        answer
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS questions_fts_insert AFTER INSERT ON questions BEGIN
+        INSERT INTO questions_fts(question_id, question, answer)
+        VALUES (new.id, new.question, new.answer);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS questions_fts_update AFTER UPDATE ON questions BEGIN
+        UPDATE questions_fts SET question = new.question, answer = new.answer
+        WHERE question_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS questions_fts_delete AFTER DELETE ON questions BEGIN
+        DELETE FROM questions_fts WHERE question_id = old.id;
+    END
+    """,
+)
+
+_local = threading.local()
+
+
+@lru_cache(maxsize=2048)
+def _prepare_fts_query(query: str) -> str:
+    """Prepare and sanitize the FTS5 query string.
+    
+    Memoized, since the same few queries are searched over and over.
+    
+    Args:
+        query: Raw search query from user
+        
+    Returns:
+        Sanitized FTS5 query string
+    """
+    words = query.strip().split()
+    if not words:
+        return '""'
+    
+    # Escape quotes in each word and create OR query for broader results
+    escaped_words = []
+    for word in words:
+        escaped_word = word.replace('"', '""')
+        escaped_words.append(f'"{escaped_word}"')
+    return ' OR '.join(escaped_words)
+
+
+def _get_connection(db_path: str) -> sqlite3.Connection:
+    """Get the calling thread's connection to a database, opening it on first use.
+    
+    Searches run on worker threads, so each thread keeps one connection per
+    database and its statement cache instead of reconnecting for every query.
+    """
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        connections[db_path] = conn
+    return conn
 
 
 class SQLiteFtsStrategy(SearchStrategy):
@@ -29,11 +134,13 @@ class SQLiteFtsStrategy(SearchStrategy):
         """
         self.database_url = database_url
     
-    async def search_questions(
+    @run_in_thread
+    def search_questions(
         self, 
         query: str, 
         user_id: UUID, 
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[float, UUID]] = None
     ) -> List[SearchResult]:
         """Search questions using SQLite FTS5.
         
@@ -41,6 +148,7 @@ class SQLiteFtsStrategy(SearchStrategy):
             query: The search query string
             user_id: User ID to scope the search to user's questions only
             limit: Maximum number of results to return (default: 50)
+            after: (rank, question_id) of the last result of the previous page
             
         Returns:
             List of SearchResult objects ordered by relevance score
@@ -56,48 +164,39 @@ class SQLiteFtsStrategy(SearchStrategy):
             raise ValidationError("Limit must be between 1 and 100")
         
         try:
-            with sqlite3.connect(self._get_db_path()) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                fts_query = self._prepare_fts_query(query)
-                
-                search_sql = """
-                SELECT 
-                    q.id as question_id,
-                    q.question,
-                    q.answer,
-                    snippet(questions_fts, 1, '<mark>', '</mark>', '...', 32) as highlight,
-                    bm25(questions_fts) as score
-                FROM questions_fts 
-                JOIN questions q ON q.id = questions_fts.question_id
-                JOIN study_books sb ON sb.id = q.study_book_id
-                WHERE questions_fts MATCH ? 
-                AND sb.user_id = ?
-                ORDER BY bm25(questions_fts) ASC
-                LIMIT ?
-                """
-                
-                cursor.execute(search_sql, (fts_query, str(user_id), limit))
-                rows = cursor.fetchall()
-                
-                return [
-                    SearchResult(
-                        question_id=UUID(row['question_id']),
-                        question=row['question'],
-                        answer=row['answer'],
-                        highlight=row['highlight'] or row['question'],
-                        score=max(0.0, 1.0 / (1.0 + abs(row['score'])))
-                    )
-                    for row in rows
-                ]
-                
+            conn = _get_connection(self._get_db_path())
+            fts_query = _prepare_fts_query(query)
+            
+            after_rank, after_id = after if after else (None, None)
+            
+            rows = conn.execute(SEARCH_SQL, {
+                "query": fts_query,
+                "user_id": str(user_id),
+                "after_rank": after_rank,
+                "after_id": str(after_id) if after_id else None,
+                "limit": limit,
+            }).fetchall()
+            
+            return [
+                SearchResult(
+                    question_id=UUID(row['question_id']),
+                    question=row['question'],
+                    answer=row['answer'],
+                    highlight=row['highlight'] or row['question'],
+                    score=max(0.0, 1.0 / (1.0 + abs(row['score']))),
+                    total_count=row['total_count'],
+                    rank=row['score']
+                )
+                for row in rows
+            ]
+            
         except sqlite3.Error as e:
             raise SearchIndexError(f"SQLite search error: {str(e)}")
         except Exception as e:
             raise SearchIndexError(f"Unexpected search error: {str(e)}")
     
-    async def rebuild_index(self) -> None:
+    @run_in_thread
+    def rebuild_index(self) -> None:
         """Rebuild the FTS5 search index.
         
         This method rebuilds the questions_fts virtual table from the questions table,
@@ -107,10 +206,8 @@ class SQLiteFtsStrategy(SearchStrategy):
             SearchIndexError: If index rebuild fails
         """
         try:
-            with sqlite3.connect(self._get_db_path()) as conn:
-                cursor = conn.cursor()
-                cursor.execute("INSERT INTO questions_fts(questions_fts) VALUES('rebuild')")
-                conn.commit()
+            with _get_connection(self._get_db_path()) as conn:
+                conn.execute("INSERT INTO questions_fts(questions_fts) VALUES('rebuild')")
                 
         except sqlite3.Error as e:
             raise SearchIndexError(f"Failed to rebuild search index: {str(e)}")
@@ -120,23 +217,3 @@ class SQLiteFtsStrategy(SearchStrategy):
     def _get_db_path(self) -> str:
         """Extract the database file path from the database URL."""
         return self.database_url.replace('sqlite:///', '')
-    
-    def _prepare_fts_query(self, query: str) -> str:
-        """Prepare and sanitize the FTS5 query string.
-        
-        Args:
-            query: Raw search query from user
-            
-        Returns:
-            Sanitized FTS5 query string
-        """
-        words = query.strip().split()
-        if not words:
-            return '""'
-        
-        # Escape quotes in each word and create OR query for broader results
-        escaped_words = []
-        for word in words:
-            escaped_word = word.replace('"', '""')
-            escaped_words.append(f'"{escaped_word}"')
-        return ' OR '.join(escaped_words)
\ No newline at end of file
@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import FastAPI, Request, Depends, APIRouter, Header
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -36,6 +36,7 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     description="Instant Search Backend API with Frontend Compatibility Layer",
@@ -109,7 +110,7 @@ async def domain_exception_handler(request: Request, exc: DomainException):
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": type(exc).__name__,
@@ -138,7 +139,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": "ValidationError",
@@ -170,7 +171,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         exc_info=True  # Include stack trace
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "InternalServerError",
@@ -0,0 +1,41 @@
+"""PostgreSQL full-text search column and GIN index
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the generated tsvector column and its GIN index on PostgreSQL."""
+    
+    # SQLite keeps using the FTS5 table from the initial migration
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.execute("""
+        ALTER TABLE questions ADD COLUMN search_vec tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english', coalesce(question, '') || ' ' || coalesce(answer, ''))
+        ) STORED
+    """)
+    op.execute("CREATE INDEX questions_search_gin ON questions USING GIN (search_vec)")
+
+
+def downgrade() -> None:
+    """Drop the PostgreSQL full-text search column and index."""
+    
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.execute("DROP INDEX IF EXISTS questions_search_gin")
+    op.execute("ALTER TABLE questions DROP COLUMN IF EXISTS search_vec")
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""PostgreSQL trigram indexes for substring search
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add pg_trgm GIN indexes backing lower(...) LIKE '%term%' matching."""
+    
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX questions_question_trgm ON questions "
+        "USING GIN (lower(question) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX questions_answer_trgm ON questions "
+        "USING GIN (lower(answer) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes; the extension is left installed."""
+    
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.execute("DROP INDEX IF EXISTS questions_answer_trgm")
+    op.execute("DROP INDEX IF EXISTS questions_question_trgm")
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""PostgreSQL weighted search vector
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Weight question text above answer text in the generated search vector."""
+    
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    # Generated columns can't be altered in place, so recreate it and its index
+    op.execute("DROP INDEX IF EXISTS questions_search_gin")
+    op.execute("ALTER TABLE questions DROP COLUMN IF EXISTS search_vec")
+    op.execute("""
+        ALTER TABLE questions ADD COLUMN search_vec tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(question, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(answer, '')), 'B')
+        ) STORED
+    """)
+    op.execute("CREATE INDEX questions_search_gin ON questions USING GIN (search_vec)")
+
+
+def downgrade() -> None:
+    """Restore the unweighted search vector."""
+    
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.execute("DROP INDEX IF EXISTS questions_search_gin")
+    op.execute("ALTER TABLE questions DROP COLUMN IF EXISTS search_vec")
+    op.execute("""
+        ALTER TABLE questions ADD COLUMN search_vec tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english', coalesce(question, '') || ' ' || coalesce(answer, ''))
+        ) STORED
+    """)
+    op.execute("CREATE INDEX questions_search_gin ON questions USING GIN (search_vec)")
\ No newline at end of file
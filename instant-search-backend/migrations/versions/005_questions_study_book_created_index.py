@@ -0,0 +1,36 @@
+"""Composite index for listing questions by study book
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the study_book_id index with a (study_book_id, created_at) one."""
+    
+    # The composite index serves every lookup the single-column one did
+    op.create_index(
+        'idx_questions_study_book_created',
+        'questions',
+        ['study_book_id', sa.text('created_at DESC')],
+        postgresql_include=['question', 'answer']
+    )
+    op.drop_index('idx_questions_study_book_id', table_name='questions')
+
+
+def downgrade() -> None:
+    """Restore the single-column study_book_id index."""
+    
+    op.create_index('idx_questions_study_book_id', 'questions', ['study_book_id'])
+    op.drop_index('idx_questions_study_book_created', table_name='questions')
\ No newline at end of file
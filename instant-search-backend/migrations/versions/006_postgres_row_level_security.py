@@ -0,0 +1,59 @@
+"""PostgreSQL row-level security for study books and questions
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Restrict study books and questions to the user in the app.user_id setting.
+    
+    The application sets app.user_id for each transaction. Table owners bypass
+    row-level security, so the application should connect as a role that does
+    not own these tables; migrations and seeding keep running as the owner.
+    """
+    
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.execute("ALTER TABLE study_books ENABLE ROW LEVEL SECURITY")
+    op.execute("""
+        CREATE POLICY study_books_user_scope ON study_books
+        USING (user_id = current_setting('app.user_id', true))
+        WITH CHECK (user_id = current_setting('app.user_id', true))
+    """)
+    
+    op.execute("ALTER TABLE questions ENABLE ROW LEVEL SECURITY")
+    op.execute("""
+        CREATE POLICY questions_user_scope ON questions
+        USING (study_book_id IN (
+            SELECT id FROM study_books
+            WHERE user_id = current_setting('app.user_id', true)
+        ))
+        WITH CHECK (study_book_id IN (
+            SELECT id FROM study_books
+            WHERE user_id = current_setting('app.user_id', true)
+        ))
+    """)
+
+
+def downgrade() -> None:
+    """Drop the row-level security policies."""
+    
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.execute("DROP POLICY IF EXISTS questions_user_scope ON questions")
+    op.execute("ALTER TABLE questions DISABLE ROW LEVEL SECURITY")
+    op.execute("DROP POLICY IF EXISTS study_books_user_scope ON study_books")
+    op.execute("ALTER TABLE study_books DISABLE ROW LEVEL SECURITY")
\ No newline at end of file
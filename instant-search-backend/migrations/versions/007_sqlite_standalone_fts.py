@@ -0,0 +1,111 @@
+"""SQLite standalone FTS5 search index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def _drop_fts() -> None:
+    """Drop the FTS5 sync triggers and virtual table."""
+    op.execute("DROP TRIGGER IF EXISTS questions_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS questions_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS questions_fts_insert")
+    op.execute("DROP TABLE IF EXISTS questions_fts")
+
+
+def upgrade() -> None:
+    """Rebuild questions_fts as a standalone FTS5 table.
+
+    The table from 001 reads its content from the questions table, which
+    has no question_id column, so every search against it fails. A
+    standalone table stores its own copy of the indexed text, which is what
+    SQLiteFtsStrategy and the existing triggers expect.
+    """
+
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    _drop_fts()
+
+    op.execute("""
+        CREATE VIRTUAL TABLE questions_fts USING fts5(
+            question_id UNINDEXED,
+            question,
+            answer
+        )
+    """)
+
+    # Index the questions that already exist
+    op.execute("""
+        INSERT INTO questions_fts(question_id, question, answer)
+        SELECT id, question, answer FROM questions
+    """)
+
+    op.execute("""
+        CREATE TRIGGER questions_fts_insert AFTER INSERT ON questions BEGIN
+            INSERT INTO questions_fts(question_id, question, answer)
+            VALUES (new.id, new.question, new.answer);
+        END
+    """)
+
+    op.execute("""
+        CREATE TRIGGER questions_fts_update AFTER UPDATE ON questions BEGIN
+            UPDATE questions_fts SET question = new.question, answer = new.answer
+            WHERE question_id = new.id;
+        END
+    """)
+
+    op.execute("""
+        CREATE TRIGGER questions_fts_delete AFTER DELETE ON questions BEGIN
+            DELETE FROM questions_fts WHERE question_id = old.id;
+        END
+    """)
+
+
+def downgrade() -> None:
+    """Restore the external-content FTS5 table from 001."""
+
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    _drop_fts()
+
+    op.execute("""
+        CREATE VIRTUAL TABLE questions_fts USING fts5(
+            question_id UNINDEXED,
+            question,
+            answer,
+            content='questions',
+            content_rowid='rowid'
+        )
+    """)
+
+    op.execute("""
+        CREATE TRIGGER questions_fts_insert AFTER INSERT ON questions BEGIN
+            INSERT INTO questions_fts(question_id, question, answer)
+            VALUES (new.id, new.question, new.answer);
+        END
+    """)
+
+    op.execute("""
+        CREATE TRIGGER questions_fts_update AFTER UPDATE ON questions BEGIN
+            UPDATE questions_fts SET question = new.question, answer = new.answer
+            WHERE question_id = new.id;
+        END
+    """)
+
+    op.execute("""
+        CREATE TRIGGER questions_fts_delete AFTER DELETE ON questions BEGIN
+            DELETE FROM questions_fts WHERE question_id = old.id;
+        END
+    """)
@@ -18,16 +18,26 @@ Usage:
     make seed
 """
 
+import csv
+import io
 import sys
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional, Tuple
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
 
 # Add the parent directory to the path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from domain.models import User, StudyBook, Question, TypingLog, LearningEvent
+from domain.models import User, StudyBook
 from infra.database import (
     get_database_config, 
     UserModel, 
@@ -41,6 +51,115 @@ from infra.database import (
 TYPING_LOGS_PER_USER = 10
 LEARNING_EVENTS_PER_USER = 18
 QUESTIONS_PER_STUDY_BOOK = 5
+SEED_WORKERS = 5
+SEED_POOL_SIZE = 8
+
+# Seed data is replaceable, so durability is relaxed for the seed run only
+SQLITE_SEED_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",
+)
+POSTGRESQL_SEED_SETTINGS = (
+    "SET synchronous_commit = OFF",
+)
+
+# Sample questions as (language, difficulty, question, answer)
+QUESTIONS_DATA = [
+    ("Python", "easy", "What is a list in Python?", "A mutable sequence type that can hold multiple items"),
+    ("Python", "easy", "How do you define a function?", "def function_name(parameters): return value"),
+    ("Python", "medium", "What is list comprehension?", "[expression for item in iterable if condition]"),
+    ("Python", "hard", "What is a decorator?", "A function that modifies another function's behavior"),
+    ("JavaScript", "easy", "How do you declare a variable?", "let variableName = value; or const variableName = value;"),
+    ("JavaScript", "easy", "What is an array?", "A collection of elements stored in a single variable"),
+    ("JavaScript", "medium", "What is a closure?", "A function that has access to outer scope variables"),
+    ("SQL", "easy", "How do you select all columns?", "SELECT * FROM table_name;"),
+    ("SQL", "medium", "What is a JOIN?", "Combines rows from multiple tables based on related columns"),
+    ("SQL", "hard", "What is a subquery?", "A query nested inside another query"),
+    ("HTML", "easy", "What is a div element?", "<div> is a generic container element for grouping content"),
+    ("CSS", "easy", "How do you set text color?", "color: red; or color: #ff0000; or color: rgb(255,0,0);"),
+    ("CSS", "medium", "What is flexbox?", "A layout method for arranging items in rows or columns"),
+    ("Algorithms", "medium", "What is Big O notation?", "Mathematical notation describing algorithm complexity"),
+    ("Algorithms", "hard", "What is dynamic programming?", "Optimization technique using memoization to avoid redundant calculations")
+]
+
+# Questions grouped by language, built once at import time
+QUESTIONS_BY_LANG = defaultdict(list)
+for _question in QUESTIONS_DATA:
+    QUESTIONS_BY_LANG[_question[0]].append(_question)
+QUESTIONS_BY_LANG = dict(QUESTIONS_BY_LANG)
+
+# Study book title keyword -> questions seeded into matching study books
+QUESTIONS_BY_TOPIC = {
+    "Python": QUESTIONS_BY_LANG["Python"],
+    "JavaScript": QUESTIONS_BY_LANG["JavaScript"],
+    "SQL": QUESTIONS_BY_LANG["SQL"],
+    "HTML": QUESTIONS_BY_LANG["HTML"] + QUESTIONS_BY_LANG["CSS"],
+    "Data Structures": QUESTIONS_BY_LANG["Algorithms"],
+}
+
+
+def insert_in_savepoints(session, model, rows: List[dict], label: str) -> List[dict]:
+    """Insert a batch of rows inside a SAVEPOINT, bisecting it on failure.
+
+    Rows are plain column dicts sent as a single Core ``INSERT`` executemany,
+    bypassing the ORM unit of work. A failing row only rolls back the
+    savepoint of the sub-batch it belongs to, so the batch is halved and
+    retried until the offending rows are isolated and skipped. The caller
+    commits once the whole batch has been processed.
+
+    Returns:
+        The rows that were inserted successfully
+    """
+    if not rows:
+        return []
+
+    try:
+        with session.begin_nested():
+            session.execute(insert(model.__table__), rows)
+        return rows
+    except SQLAlchemyError as e:
+        if len(rows) == 1:
+            print(f"✗ Error creating {label}: {e}")
+            return []
+        middle = len(rows) // 2
+        return (
+            insert_in_savepoints(session, model, rows[:middle], label)
+            + insert_in_savepoints(session, model, rows[middle:], label)
+        )
+
+
+def copy_rows(session, model, rows: List[dict]) -> int:
+    """Stream rows into a PostgreSQL table with ``COPY FROM STDIN``.
+
+    The rows are written to an in-memory CSV buffer in table column order and
+    sent over the session's own connection, so they belong to the current
+    transaction. ``None`` values become unquoted empty fields, which COPY
+    reads as NULL.
+
+    Returns:
+        Number of rows copied
+    """
+    if not rows:
+        return 0
+
+    columns = [column.name for column in model.__table__.columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([row[column] for column in columns])
+    buffer.seek(0)
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {model.__tablename__} ({', '.join(columns)}) FROM STDIN WITH CSV",
+            buffer
+        )
+    finally:
+        cursor.close()
+    return len(rows)
 
 
 def create_sample_users(session) -> List[User]:
@@ -54,56 +173,50 @@ def create_sample_users(session) -> List[User]:
     ]
     
     created_users = []
+    new_users = []
+    skipped = 0
     
     for name, email in users_data:
-        try:
-            # Check if user already exists (idempotent operation)
-            existing_user = session.query(UserModel).filter(UserModel.email == email.lower()).first()
-            
-            if existing_user:
-                # Convert existing user to domain model
-                existing = User(
-                    id=existing_user.id,
-                    name=existing_user.name,
-                    email=existing_user.email,
-                    created_at=datetime.fromisoformat(existing_user.created_at.replace('Z', '+00:00')),
-                    updated_at=datetime.fromisoformat(existing_user.updated_at.replace('Z', '+00:00'))
-                )
-                created_users.append(existing)
-                print(f"✓ User {email} already exists, using existing user")
-            else:
-                # Create new user
-                user_id = str(uuid4())
-                now = datetime.utcnow().isoformat() + 'Z'
-                
-                db_user = UserModel(
-                    id=user_id,
-                    name=name,
-                    email=email.lower(),
-                    created_at=now,
-                    updated_at=now
-                )
-                
-                session.add(db_user)
-                session.commit()
-                
-                # Convert to domain model
-                user = User(
-                    id=user_id,
-                    name=name,
-                    email=email,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
-                )
-                
-                created_users.append(user)
-                print(f"✓ Created user: {name} ({email})")
-                
-        except Exception as e:
-            print(f"✗ Error processing user {email}: {e}")
-            session.rollback()
-            continue
+        # Check if user already exists (idempotent operation)
+        existing_user = session.query(UserModel).filter(UserModel.email == email.lower()).first()
+        
+        if existing_user:
+            # Convert existing user to domain model
+            existing = User(
+                id=existing_user.id,
+                name=existing_user.name,
+                email=existing_user.email,
+                created_at=datetime.fromisoformat(existing_user.created_at.replace('Z', '+00:00')),
+                updated_at=datetime.fromisoformat(existing_user.updated_at.replace('Z', '+00:00'))
+            )
+            created_users.append(existing)
+            skipped += 1
+        else:
+            # Queue new user for the batch insert
+            now = datetime.utcnow().isoformat() + 'Z'
+            new_users.append({
+                "id": str(uuid4()),
+                "name": name,
+                "email": email.lower(),
+                "created_at": now,
+                "updated_at": now
+            })
+    
+    inserted_users = insert_in_savepoints(session, UserModel, new_users, "user")
+    for db_user in inserted_users:
+        # Convert to domain model
+        user = User(
+            id=db_user["id"],
+            name=db_user["name"],
+            email=db_user["email"],
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        )
+        
+        created_users.append(user)
     
+    session.commit()
+    print(f"✓ {len(inserted_users)} users created, {skipped} already existed")
     return created_users
 
 
@@ -118,211 +231,177 @@ def create_sample_study_books(session, users: List[User]) -> List[StudyBook]:
     ]
     
     created_books = []
+    new_books = []
+    skipped = 0
     
     for user in users:
+        user_id = str(user.id)
         for title, description in study_books_data[:3]:  # 3 books per user
             book_title = f"{title} - {user.name}"
             
-            try:
-                # Check if study book already exists (idempotent operation)
-                existing_book = session.query(StudyBookModel).filter(
-                    StudyBookModel.user_id == str(user.id),
-                    StudyBookModel.title == book_title
-                ).first()
-                
-                if existing_book:
-                    # Convert existing book to domain model
-                    existing = StudyBook(
-                        id=existing_book.id,
-                        user_id=existing_book.user_id,
-                        title=existing_book.title,
-                        description=existing_book.description,
-                        created_at=datetime.fromisoformat(existing_book.created_at.replace('Z', '+00:00')),
-                        updated_at=datetime.fromisoformat(existing_book.updated_at.replace('Z', '+00:00'))
-                    )
-                    created_books.append(existing)
-                    print(f"✓ Study book '{book_title}' already exists")
-                else:
-                    # Create new study book
-                    book_id = str(uuid4())
-                    now = datetime.utcnow().isoformat() + 'Z'
-                    
-                    db_book = StudyBookModel(
-                        id=book_id,
-                        user_id=str(user.id),
-                        title=book_title,
-                        description=description,
-                        created_at=now,
-                        updated_at=now
-                    )
-                    
-                    session.add(db_book)
-                    session.commit()
-                    
-                    # Convert to domain model
-                    book = StudyBook(
-                        id=book_id,
-                        user_id=str(user.id),
-                        title=book_title,
-                        description=description,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow()
-                    )
-                    
-                    created_books.append(book)
-                    print(f"✓ Created study book: {book_title}")
-                    
-            except Exception as e:
-                print(f"✗ Error processing study book '{book_title}': {e}")
-                session.rollback()
-                continue
+            # Check if study book already exists (idempotent operation)
+            existing_book = session.query(StudyBookModel).filter(
+                StudyBookModel.user_id == user_id,
+                StudyBookModel.title == book_title
+            ).first()
+            
+            if existing_book:
+                # Convert existing book to domain model
+                existing = StudyBook(
+                    id=existing_book.id,
+                    user_id=existing_book.user_id,
+                    title=existing_book.title,
+                    description=existing_book.description,
+                    created_at=datetime.fromisoformat(existing_book.created_at.replace('Z', '+00:00')),
+                    updated_at=datetime.fromisoformat(existing_book.updated_at.replace('Z', '+00:00'))
+                )
+                created_books.append(existing)
+                skipped += 1
+            else:
+                # Queue new study book for the batch insert
+                now = datetime.utcnow().isoformat() + 'Z'
+                new_books.append({
+                    "id": str(uuid4()),
+                    "user_id": user_id,
+                    "title": book_title,
+                    "description": description,
+                    "created_at": now,
+                    "updated_at": now
+                })
     
-    return created_books
-def create_sample_questions(session, study_books: List[StudyBook]) -> List[Question]:
-    """Create sample questions with idempotent operations."""
-    questions_data = [
-        ("Python", "easy", "What is a list in Python?", "A mutable sequence type that can hold multiple items"),
-        ("Python", "easy", "How do you define a function?", "def function_name(parameters): return value"),
-        ("Python", "medium", "What is list comprehension?", "[expression for item in iterable if condition]"),
-        ("Python", "hard", "What is a decorator?", "A function that modifies another function's behavior"),
-        ("JavaScript", "easy", "How do you declare a variable?", "let variableName = value; or const variableName = value;"),
-        ("JavaScript", "easy", "What is an array?", "A collection of elements stored in a single variable"),
-        ("JavaScript", "medium", "What is a closure?", "A function that has access to outer scope variables"),
-        ("SQL", "easy", "How do you select all columns?", "SELECT * FROM table_name;"),
-        ("SQL", "medium", "What is a JOIN?", "Combines rows from multiple tables based on related columns"),
-        ("SQL", "hard", "What is a subquery?", "A query nested inside another query"),
-        ("HTML", "easy", "What is a div element?", "<div> is a generic container element for grouping content"),
-        ("CSS", "easy", "How do you set text color?", "color: red; or color: #ff0000; or color: rgb(255,0,0);"),
-        ("CSS", "medium", "What is flexbox?", "A layout method for arranging items in rows or columns"),
-        ("Algorithms", "medium", "What is Big O notation?", "Mathematical notation describing algorithm complexity"),
-        ("Algorithms", "hard", "What is dynamic programming?", "Optimization technique using memoization to avoid redundant calculations")
-    ]
+    inserted_books = insert_in_savepoints(session, StudyBookModel, new_books, "study book")
+    for db_book in inserted_books:
+        # Convert to domain model
+        book = StudyBook(
+            id=db_book["id"],
+            user_id=db_book["user_id"],
+            title=db_book["title"],
+            description=db_book["description"],
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        )
+        
+        created_books.append(book)
     
-    created_questions = []
+    session.commit()
+    print(f"✓ {len(inserted_books)} study books created, {skipped} already existed")
+    return created_books
+
+
+def create_sample_questions(session, study_books: List[StudyBook]) -> int:
+    """Create sample questions with idempotent operations.
+
+    Returns:
+        Number of questions in the sample study books, existing ones included
+    """
+    new_questions = []
+    skipped = 0
     
     for study_book in study_books:
+        study_book_id = str(study_book.id)
+        
         # Determine which questions to add based on study book title
-        relevant_questions = []
-        if "Python" in study_book.title:
-            relevant_questions = [q for q in questions_data if q[0] == "Python"]
-        elif "JavaScript" in study_book.title:
-            relevant_questions = [q for q in questions_data if q[0] == "JavaScript"]
-        elif "SQL" in study_book.title:
-            relevant_questions = [q for q in questions_data if q[0] == "SQL"]
-        elif "HTML" in study_book.title:
-            relevant_questions = [q for q in questions_data if q[0] in ["HTML", "CSS"]]
-        elif "Data Structures" in study_book.title:
-            relevant_questions = [q for q in questions_data if q[0] == "Algorithms"]
-        else:
-            # Default: add first 4 questions
-            relevant_questions = questions_data[:4]
+        topic = next((topic for topic in QUESTIONS_BY_TOPIC if topic in study_book.title), None)
+        # Default: add first 4 questions
+        relevant_questions = QUESTIONS_BY_TOPIC.get(topic, QUESTIONS_DATA[:4])
         
         # Add questions per study book
         for language, difficulty, question_text, answer in relevant_questions[:QUESTIONS_PER_STUDY_BOOK]:
-            try:
-                # Check if question already exists (idempotent operation)
-                existing_question = session.query(QuestionModel).filter(
-                    QuestionModel.study_book_id == str(study_book.id),
-                    QuestionModel.question == question_text
-                ).first()
-                
-                if existing_question:
-                    print(f"✓ Question '{question_text[:30]}...' already exists")
-                    # Just count it, don't create domain model to avoid validation issues
-                    created_questions.append(None)  # Placeholder for counting
-                else:
-                    # Create new question directly in database
-                    question_id = str(uuid4())
-                    now = datetime.utcnow().isoformat() + 'Z'
-                    
-                    db_question = QuestionModel(
-                        id=question_id,
-                        study_book_id=str(study_book.id),
-                        language=language,
-                        category="General",
-                        difficulty=difficulty,
-                        question=question_text,
-                        answer=answer,
-                        created_at=now,
-                        updated_at=now
-                    )
-                    
-                    session.add(db_question)
-                    session.commit()
-                    
-                    # Just count it, don't create domain model to avoid validation issues
-                    created_questions.append(None)  # Placeholder for counting
-                    print(f"✓ Created question: {question_text[:50]}...")
-                    
-            except Exception as e:
-                print(f"✗ Error processing question '{question_text[:30]}...': {e}")
-                session.rollback()
-                continue
+            # Check if question already exists (idempotent operation)
+            existing_question = session.query(QuestionModel).filter(
+                QuestionModel.study_book_id == study_book_id,
+                QuestionModel.question == question_text
+            ).first()
+            
+            if existing_question:
+                skipped += 1
+            else:
+                # Queue new question for the batch insert
+                now = datetime.utcnow().isoformat() + 'Z'
+                new_questions.append({
+                    "id": str(uuid4()),
+                    "study_book_id": study_book_id,
+                    "language": language,
+                    "category": "General",
+                    "difficulty": difficulty,
+                    "question": question_text,
+                    "answer": answer,
+                    "created_at": now,
+                    "updated_at": now
+                })
     
-    return created_questions
+    # Just count the questions, don't create domain models to avoid validation issues
+    created = len(insert_in_savepoints(session, QuestionModel, new_questions, "question"))
+    
+    session.commit()
+    print(f"✓ {created} questions created, {skipped} already existed")
+    return created + skipped
+
 
+def create_sample_typing_logs(session, users: List[User]) -> int:
+    """Create sample typing logs with realistic performance data.
 
-def create_sample_typing_logs(session, users: List[User], questions: List[Question]) -> List[TypingLog]:
-    """Create sample typing logs with realistic performance data."""
-    created_logs = []
+    Returns:
+        Number of typing logs created
+    """
+    new_logs = []
+    
+    # Get actual questions from database to reference from the logs
+    db_questions = session.query(QuestionModel).all()
     
     for user in users:
         # Create typing logs per user with realistic progression
         num_logs = TYPING_LOGS_PER_USER
+        user_id = str(user.id)
         
         for i in range(num_logs):
-            try:
-                # Simulate improving performance over time with some variation
-                days_ago = num_logs - i  # Most recent logs first
-                base_wpm = 25 + (i * 3)  # Gradual improvement from 25 to ~55 WPM
-                wpm_variation = (i % 4) * 2  # Add some realistic variation
-                wpm = min(80, base_wpm + wpm_variation)  # Cap at reasonable maximum
-                
-                # Accuracy improves over time but has realistic variation
-                base_accuracy = 0.65 + (i * 0.03)  # Improve from 65% to ~95%
-                accuracy_variation = (i % 3) * 0.02  # Small variations
-                accuracy = min(0.98, base_accuracy + accuracy_variation)
-                
-                # Duration varies based on WPM and question complexity
-                base_duration = 90000 - (i * 3000)  # Faster over time
-                duration_variation = (i % 5) * 5000
-                took_ms = max(30000, base_duration + duration_variation)
-                
-                # Get actual questions from database since the questions list contains None placeholders
-                db_questions = session.query(QuestionModel).all()
-                question_id = db_questions[i % len(db_questions)].id if db_questions else None
-                
-                log_id = str(uuid4())
-                created_at = (datetime.utcnow() - timedelta(days=days_ago)).isoformat() + 'Z'
-                
-                db_log = TypingLogModel(
-                    id=log_id,
-                    user_id=str(user.id),
-                    question_id=str(question_id) if question_id else None,
-                    wpm=wpm,
-                    accuracy=accuracy,
-                    took_ms=took_ms,
-                    created_at=created_at
-                )
-                
-                session.add(db_log)
-                session.commit()
-                
-                # Just count it, don't create domain model to avoid validation issues
-                created_logs.append(None)  # Placeholder for counting
-                print(f"✓ Created typing log: {wpm} WPM, {accuracy:.1%} accuracy for {user.name}")
-                
-            except Exception as e:
-                print(f"✗ Error creating typing log for {user.name}: {e}")
-                session.rollback()
-                continue
+            # Simulate improving performance over time with some variation
+            days_ago = num_logs - i  # Most recent logs first
+            base_wpm = 25 + (i * 3)  # Gradual improvement from 25 to ~55 WPM
+            wpm_variation = (i % 4) * 2  # Add some realistic variation
+            wpm = min(80, base_wpm + wpm_variation)  # Cap at reasonable maximum
+            
+            # Accuracy improves over time but has realistic variation
+            base_accuracy = 0.65 + (i * 0.03)  # Improve from 65% to ~95%
+            accuracy_variation = (i % 3) * 0.02  # Small variations
+            accuracy = min(0.98, base_accuracy + accuracy_variation)
+            
+            # Duration varies based on WPM and question complexity
+            base_duration = 90000 - (i * 3000)  # Faster over time
+            duration_variation = (i % 5) * 5000
+            took_ms = max(30000, base_duration + duration_variation)
+            
+            question_id = db_questions[i % len(db_questions)].id if db_questions else None
+            
+            log_id = str(uuid4())
+            created_at = (datetime.utcnow() - timedelta(days=days_ago)).isoformat() + 'Z'
+            
+            new_logs.append({
+                "id": log_id,
+                "user_id": user_id,
+                "question_id": question_id,
+                "wpm": wpm,
+                "accuracy": accuracy,
+                "took_ms": took_ms,
+                "created_at": created_at
+            })
+    
+    # Just count the logs, don't create domain models to avoid validation issues
+    created = len(insert_in_savepoints(session, TypingLogModel, new_logs, "typing log"))
     
-    return created_logs
+    session.commit()
+    print(f"✓ {created} typing logs created, {len(new_logs) - created} skipped "
+          f"for {', '.join(user.name for user in users)}")
+    return created
+
 
+def create_sample_learning_events(session, users: List[User]) -> int:
+    """Create sample learning events with realistic user activity patterns.
 
-def create_sample_learning_events(session, users: List[User], study_books: List[StudyBook], questions: List[Question]) -> List[LearningEvent]:
-    """Create sample learning events with realistic user activity patterns."""
-    created_events = []
+    Returns:
+        Number of learning events created
+    """
+    new_events = []
     
     # Define realistic learning actions
     actions = [
@@ -334,79 +413,162 @@ def create_sample_learning_events(session, users: List[User], study_books: List[
     for user in users:
         # Create learning events per user over the past 2 weeks
         num_events = LEARNING_EVENTS_PER_USER
+        user_id = str(user.id)
+        
+        # Get actual study books and questions from database once per user
+        user_books = session.query(StudyBookModel).filter(StudyBookModel.user_id == user_id).all()
+        user_study_book_ids = [sb.id for sb in user_books]
+        user_questions = []
+        if user_study_book_ids:
+            user_questions = session.query(QuestionModel).filter(QuestionModel.study_book_id.in_(user_study_book_ids)).all()
         
         for i in range(num_events):
-            try:
-                # Distribute events over the past 2 weeks
-                hours_ago = (num_events - i) * 2  # Spread events over time
-                action = actions[i % len(actions)]
-                
-                # Create realistic object_id based on action
-                object_id = None
-                score = None
-                duration_ms = None
-                
-                if action in ["study_book_created", "study_book_opened"]:
-                    # Get actual study books from database
-                    user_books = session.query(StudyBookModel).filter(StudyBookModel.user_id == str(user.id)).all()
-                    if user_books:
-                        object_id = str(user_books[i % len(user_books)].id)
-                elif action in ["question_viewed", "question_answered_correct", "question_answered_incorrect"]:
-                    # Get actual questions from user's study books
-                    user_study_book_ids = [sb.id for sb in session.query(StudyBookModel).filter(StudyBookModel.user_id == str(user.id)).all()]
-                    if user_study_book_ids:
-                        user_questions = session.query(QuestionModel).filter(QuestionModel.study_book_id.in_(user_study_book_ids)).all()
-                        if user_questions:
-                            object_id = str(user_questions[i % len(user_questions)].id)
-                            # Add score for answered questions
-                            if "correct" in action:
-                                score = 0.85 + (i % 3) * 0.05  # 85-95% for correct
-                            elif "incorrect" in action:
-                                score = 0.3 + (i % 4) * 0.1   # 30-60% for incorrect
-                
-                # Add duration for practice sessions
-                if "practice" in action or "typing" in action:
-                    duration_ms = 45000 + (i % 6) * 15000  # 45s to 2m15s
-                elif action == "search_performed":
-                    duration_ms = 2000 + (i % 3) * 1000    # 2-5 seconds
-                
-                event_id = str(uuid4())
-                occurred_at = (datetime.utcnow() - timedelta(hours=hours_ago)).isoformat() + 'Z'
-                
-                db_event = LearningEventModel(
-                    id=event_id,
-                    user_id=str(user.id),
-                    app_id="instant-search-backend",
-                    action=action,
-                    object_id=object_id,
-                    score=score,
-                    duration_ms=duration_ms,
-                    occurred_at=occurred_at
-                )
-                
-                session.add(db_event)
-                session.commit()
-                
-                # Just count it, don't create domain model to avoid validation issues
-                created_events.append(None)  # Placeholder for counting
-                print(f"✓ Created learning event: {action} for {user.name}")
-                
-            except Exception as e:
-                print(f"✗ Error creating learning event for {user.name}: {e}")
-                session.rollback()
-                continue
+            # Distribute events over the past 2 weeks
+            hours_ago = (num_events - i) * 2  # Spread events over time
+            action = actions[i % len(actions)]
+            
+            # Create realistic object_id based on action
+            object_id = None
+            score = None
+            duration_ms = None
+            
+            if action in ["study_book_created", "study_book_opened"]:
+                if user_books:
+                    object_id = user_books[i % len(user_books)].id
+            elif action in ["question_viewed", "question_answered_correct", "question_answered_incorrect"]:
+                if user_questions:
+                    object_id = user_questions[i % len(user_questions)].id
+                    # Add score for answered questions
+                    if "correct" in action:
+                        score = 0.85 + (i % 3) * 0.05  # 85-95% for correct
+                    elif "incorrect" in action:
+                        score = 0.3 + (i % 4) * 0.1   # 30-60% for incorrect
+            
+            # Add duration for practice sessions
+            if "practice" in action or "typing" in action:
+                duration_ms = 45000 + (i % 6) * 15000  # 45s to 2m15s
+            elif action == "search_performed":
+                duration_ms = 2000 + (i % 3) * 1000    # 2-5 seconds
+            
+            event_id = str(uuid4())
+            occurred_at = (datetime.utcnow() - timedelta(hours=hours_ago)).isoformat() + 'Z'
+            
+            new_events.append({
+                "id": event_id,
+                "user_id": user_id,
+                "app_id": "instant-search-backend",
+                "action": action,
+                "object_id": object_id,
+                "score": score,
+                "duration_ms": duration_ms,
+                "occurred_at": occurred_at
+            })
+    
+    # Learning events are the largest table, so PostgreSQL gets them via COPY
+    if session.bind.dialect.name == "postgresql":
+        created = copy_rows(session, LearningEventModel, new_events)
+    else:
+        created = len(insert_in_savepoints(session, LearningEventModel, new_events, "learning event"))
     
-    return created_events
+    session.commit()
+    print(f"✓ {created} learning events created, {len(new_events) - created} skipped "
+          f"for {', '.join(user.name for user in users)}")
+    return created
+
+
+def create_seed_engine(database_url: str):
+    """Create a pooled engine shared by the per-user seeding workers.
+
+    Each worker checks out its own connection, so the pool is sized to cover
+    every worker without overflow connections. Every connection skips fsync
+    on commit; the settings are per connection and are discarded together
+    with the pool when the engine is disposed.
+    """
+    engine_options = {}
+    if make_url(database_url).get_driver_name() == "psycopg2":
+        # Send each executemany batch as multi-VALUES INSERT statements
+        engine_options["executemany_mode"] = "values_plus_batch"
+    
+    engine = create_engine(
+        database_url,
+        poolclass=QueuePool,
+        pool_size=SEED_POOL_SIZE,
+        max_overflow=0,
+        connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
+        **engine_options
+    )
+    
+    if engine.dialect.name == "sqlite":
+        statements = SQLITE_SEED_PRAGMAS
+    elif engine.dialect.name == "postgresql":
+        statements = POSTGRESQL_SEED_SETTINGS
+    else:
+        statements = ()
+    
+    @event.listens_for(engine, "connect")
+    def relax_durability(dbapi_connection, connection_record):
+        """Apply the seed-only durability settings to a new connection.
+        
+        On PostgreSQL the settings are applied in autocommit mode; inside the
+        driver's implicit transaction, the first rollback would undo them.
+        """
+        if engine.dialect.name == "postgresql":
+            autocommit = dbapi_connection.autocommit
+            dbapi_connection.autocommit = True
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+        if engine.dialect.name == "postgresql":
+            dbapi_connection.autocommit = autocommit
+    
+    return engine
+
+
+def get_sqlite_journal_mode(engine) -> Optional[str]:
+    """Get the persistent journal mode of a SQLite database, if applicable."""
+    if engine.dialect.name != "sqlite":
+        return None
+    with engine.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+
+
+def seed_user_activity(user: User, engine) -> Tuple[int, int]:
+    """Seed typing logs and learning events for a single user.
+
+    Users have no cross-user dependencies, so this runs on a worker thread
+    with its own session. Questions and study books must already be committed
+    so the foreign key references exist.
+
+    Returns:
+        Tuple of (typing logs created, learning events created)
+    """
+    session = Session(bind=engine)
+    try:
+        typing_logs = create_sample_typing_logs(session, [user])
+        learning_events = create_sample_learning_events(session, [user])
+        return typing_logs, learning_events
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
 
 
 def main():
     """Main seeding function with proper error handling and idempotent operations."""
+    # Progress is reported once per step, so there is no need to flush every line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     print("🌱 Starting database seeding...")
     print("=" * 60)
     
     # Initialize database connection
     db_config = get_database_config()
-    session = db_config.get_session()
+    journal_mode = get_sqlite_journal_mode(db_config.engine)
+    engine = create_seed_engine(db_config.database_url)
+    session = Session(bind=engine)
     
     try:
         # Create sample data with idempotent operations
@@ -420,24 +582,26 @@ def main():
         
         print("\n3️⃣  Creating sample questions...")
         questions = create_sample_questions(session, study_books)
-        print(f"   📊 Total questions: {len(questions)}")
+        print(f"   📊 Total questions: {questions}")
         
-        print("\n4️⃣  Creating sample typing logs...")
-        typing_logs = create_sample_typing_logs(session, users, questions)
-        print(f"   📊 Total typing logs: {len(typing_logs)}")
-        
-        print("\n5️⃣  Creating sample learning events...")
-        learning_events = create_sample_learning_events(session, users, study_books, questions)
-        print(f"   📊 Total learning events: {len(learning_events)}")
+        print("\n4️⃣  Creating sample typing logs and learning events...")
+        # SQLite allows a single writer, so only fan out on server databases
+        workers = 1 if engine.dialect.name == "sqlite" else SEED_WORKERS
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            activity = list(executor.map(lambda user: seed_user_activity(user, engine), users))
+        typing_logs = sum(logs for logs, _ in activity)
+        learning_events = sum(events for _, events in activity)
+        print(f"   📊 Total typing logs: {typing_logs}")
+        print(f"   📊 Total learning events: {learning_events}")
         
         print("\n" + "=" * 60)
         print("🎉 Seeding completed successfully!")
         print(f"📈 Summary:")
         print(f"   • {len(users)} users")
         print(f"   • {len(study_books)} study books")
-        print(f"   • {len(questions)} questions")
-        print(f"   • {len(typing_logs)} typing logs")
-        print(f"   • {len(learning_events)} learning events")
+        print(f"   • {questions} questions")
+        print(f"   • {typing_logs} typing logs")
+        print(f"   • {learning_events} learning events")
         print("\n💡 You can run this script multiple times safely (idempotent operations)")
         
     except Exception as e:
@@ -446,6 +610,12 @@ def main():
         raise
     finally:
         session.close()
+        engine.dispose()
+        
+        # journal_mode=MEMORY can switch a WAL database out of WAL for good
+        if journal_mode:
+            with db_config.engine.connect() as conn:
+                conn.exec_driver_sql(f"PRAGMA journal_mode={journal_mode}")
 
 
 if __name__ == "__main__":
@@ -6,39 +6,92 @@ unit and integration tests.
 """
 
 import asyncio
+import sys
 import pytest
 import pytest_asyncio
 from datetime import datetime
-from uuid import uuid4
-from typing import AsyncGenerator, Generator
+from uuid import UUID, uuid4
+from typing import AsyncGenerator, Generator, List
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
+import httpx
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
 
 from main import app
-from infra.database import DatabaseConfig, Base, get_database_config, init_database
+from api.dependencies import get_search_cache, get_search_strategy, get_system_problems_service
+from app.cached_service import CachedSystemProblemsService
+from app.search_cache import SearchResultCache
+from infra.database import (
+    DatabaseConfig, Base, get_database_config, get_db_session, init_database,
+    UserModel, StudyBookModel, QuestionModel
+)
 from domain.models import User, StudyBook, Question, TypingLog, LearningEvent
+from infra.sqlite_search import SEARCH_INDEX_DDL, SQLiteFtsStrategy
 
 
-# Test database configuration
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# Connection limits for the shared async test client
+TEST_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=50, max_connections=200, keepalive_expiry=30.0
+)
+TEST_CLIENT_TIMEOUT = httpx.Timeout(10.0)
+
+# User shared by every test that only reads; clean_db leaves its row in place
+READONLY_USER = User(
+    id=UUID("00000000-0000-4000-8000-00000000000a"),
+    name="Read-only User",
+    email="readonly@example.com",
+    created_at=datetime.utcnow(),
+    updated_at=datetime.utcnow()
+)
+
+
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--run-perf", action="store_true", default=False, help="run tests marked as performance"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip performance tests unless --run-perf is given."""
+    if config.getoption("--run-perf"):
+        return
+    
+    skip_performance = pytest.mark.skip(reason="needs --run-perf to run")
+    for item in items:
+        if "performance" in item.keywords:
+            item.add_marker(skip_performance)
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the test session loop on uvloop where available."""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+    
+    import uvloop
+    return uvloop.EventLoopPolicy()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def test_db() -> AsyncGenerator[DatabaseConfig, None]:
-    """Create a test database for each test function."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_db(tmp_path_factory: pytest.TempPathFactory) -> AsyncGenerator[DatabaseConfig, None]:
+    """Create the test database once for the whole test session.
+    
+    Each xdist worker has its own base temp directory, so workers never
+    share a database file. A file lets every pooled connection see the same
+    data and wait on SQLite's own locks, unlike an in-memory database.
+    """
     # Initialize test database
-    db_config = DatabaseConfig(TEST_DATABASE_URL)
+    database_path = tmp_path_factory.mktemp("db") / "test.db"
+    db_config = DatabaseConfig(f"sqlite:///{database_path}")
     
-    # Create all tables
+    # Create all tables and the search index
     Base.metadata.create_all(bind=db_config.engine)
+    with db_config.engine.begin() as conn:
+        for statement in SEARCH_INDEX_DDL:
+            conn.execute(text(statement))
     
     # Connect to database
     await db_config.connect()
@@ -46,36 +99,176 @@ async def test_db() -> AsyncGenerator[DatabaseConfig, None]:
     try:
         yield db_config
     finally:
-        # Clean up
+        # Clean up; the file goes away with pytest's temp directory, so there
+        # is no need to drop the tables first
         await db_config.disconnect()
-        Base.metadata.drop_all(bind=db_config.engine)
+        db_config.engine.dispose()
+
+
+@pytest.fixture
+def clean_db(test_db: DatabaseConfig) -> Generator[None, None, None]:
+    """Empty every table once the test is done.
+    
+    The schema is created once per session; deleting the rows a test wrote
+    is far cheaper than dropping and recreating the tables. The session's
+    read-only user is kept.
+    """
+    yield
+    with test_db.engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            statement = table.delete()
+            if table is UserModel.__table__:
+                statement = statement.where(UserModel.id != str(READONLY_USER.id))
+            conn.execute(statement)
 
 
 @pytest.fixture
+def db_session(test_db: DatabaseConfig, clean_db: None) -> Generator[Session, None, None]:
+    """Provide a session on the test database.
+    
+    Repositories commit as they do in the application, so requests made
+    by the test see the same rows; clean_db removes them afterwards.
+    """
+    session = test_db.get_session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="class")
+def db_connection(test_db: DatabaseConfig) -> Generator[Connection, None, None]:
+    """Provide one connection inside a transaction for a whole test class.
+    
+    The transaction is rolled back at the end, so read-only checks share a
+    single pool checkout and never commit.
+    """
+    with test_db.engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            yield connection
+        finally:
+            transaction.rollback()
+
+
+@pytest.fixture(scope="session")
 def test_client() -> Generator[TestClient, None, None]:
-    """Create a test client for the FastAPI application."""
+    """Create a test client for the FastAPI application, shared by the session.
+    
+    The OpenAPI schema is generated once up front, so /docs and
+    /openapi.json serve the cached schema instead of building it per request.
+    """
     with TestClient(app) as client:
+        app.openapi_schema = app.openapi()
         yield client
 
 
-@pytest_asyncio.fixture
-async def async_test_client(test_db: DatabaseConfig) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client for the FastAPI application."""
-    # Override the database dependency
-    def override_get_database():
-        return test_db.database
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
+    """Create the one in-process transport every async client is built on."""
+    return ASGITransport(app=app, raise_app_exceptions=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_client(asgi_transport: ASGITransport) -> AsyncGenerator[AsyncClient, None]:
+    """Create one async test client shared by the whole test session.
+    
+    The app is warmed up once before the first test: generating the OpenAPI
+    schema builds every route's request and response models up front.
+    """
+    async with AsyncClient(
+        transport=asgi_transport,
+        base_url="http://test",
+        limits=TEST_CLIENT_LIMITS,
+        timeout=TEST_CLIENT_TIMEOUT
+    ) as client:
+        response = await client.get("/openapi.json")
+        assert response.status_code == 200
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def expected_languages(
+    session_client: AsyncClient,
+    auth_headers: dict,
+    app_overrides: SearchResultCache
+) -> List[str]:
+    """Fetch the languages list once as the reference response for the session.
+    
+    Requested after the dependency overrides, so it runs against the test database.
+    """
+    response = await session_client.get("/api/v1/studybooks/languages", headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def system_problems_service() -> CachedSystemProblemsService:
+    """Load and warm the system problems once for the whole test session."""
+    service = CachedSystemProblemsService()
+    await service.warm_cache()
+    return service
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app_overrides(
+    test_db: DatabaseConfig,
+    system_problems_service: CachedSystemProblemsService
+) -> AsyncGenerator[SearchResultCache, None]:
+    """Point the app's dependencies at the test fixtures once per session.
+    
+    Yields the search cache the app is given, so tests can clear it.
+    """
+    # Snapshot the overrides so only these are undone at the end
+    overrides = app.dependency_overrides.copy()
     
+    def get_test_db_session() -> Generator[Session, None, None]:
+        session = test_db.get_session()
+        try:
+            yield session
+        finally:
+            session.close()
+    
+    search_cache = SearchResultCache()
+    search_strategy = SQLiteFtsStrategy(test_db.database_url)
+    
+    # Override the database, system problems and search dependencies
     app.dependency_overrides[get_database_config] = lambda: test_db
+    app.dependency_overrides[get_db_session] = get_test_db_session
+    app.dependency_overrides[get_system_problems_service] = lambda: system_problems_service
+    app.dependency_overrides[get_search_cache] = lambda: search_cache
+    app.dependency_overrides[get_search_strategy] = lambda: search_strategy
     
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        yield client
+    try:
+        yield search_cache
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(overrides)
+
+
+@pytest_asyncio.fixture
+async def async_test_client(
+    session_client: AsyncClient,
+    clean_db: None,
+    app_overrides: SearchResultCache
+) -> AsyncGenerator[AsyncClient, None]:
+    """Provide the shared async test client wired to the test database.
     
-    # Clean up dependency override
-    app.dependency_overrides.clear()
+    The client and its dependency overrides live for the whole session;
+    what the test writes through it is cleared by clean_db afterwards.
+    """
+    search_cache = app_overrides
+    try:
+        yield session_client
+    finally:
+        # The test's data is cleared, so no later test may see its searches
+        search_cache.clear()
 
 
 # Sample data fixtures
-@pytest.fixture
+# These are shared read-only across the session; use test_data_factory for
+# an instance a test needs to modify.
+@pytest.fixture(scope="session")
 def sample_user() -> User:
     """Create a sample user for testing."""
     return User(
@@ -87,7 +280,7 @@ def sample_user() -> User:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user_2() -> User:
     """Create a second sample user for testing."""
     return User(
@@ -99,7 +292,7 @@ def sample_user_2() -> User:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_study_book(sample_user: User) -> StudyBook:
     """Create a sample study book for testing."""
     return StudyBook(
@@ -112,7 +305,7 @@ def sample_study_book(sample_user: User) -> StudyBook:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_question(sample_study_book: StudyBook) -> Question:
     """Create a sample question for testing."""
     return Question(
@@ -128,7 +321,7 @@ def sample_question(sample_study_book: StudyBook) -> Question:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_typing_log(sample_user: User, sample_question: Question) -> TypingLog:
     """Create a sample typing log for testing."""
     return TypingLog(
@@ -142,7 +335,7 @@ def sample_typing_log(sample_user: User, sample_question: Question) -> TypingLog
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_learning_event(sample_user: User) -> LearningEvent:
     """Create a sample learning event for testing."""
     return LearningEvent(
@@ -158,67 +351,120 @@ def sample_learning_event(sample_user: User) -> LearningEvent:
 
 
 # Database helper fixtures
-@pytest_asyncio.fixture
-async def db_with_user(test_db: DatabaseConfig, sample_user: User) -> User:
+def insert_users(test_db: DatabaseConfig, *users: User) -> None:
+    """Insert user rows with a single executemany, bypassing the ORM."""
+    with test_db.engine.begin() as connection:
+        connection.execute(UserModel.__table__.insert(), [_user_row(user) for user in users])
+
+
+@pytest.fixture
+def db_with_user(test_db: DatabaseConfig, clean_db: None, sample_user: User) -> User:
     """Create a test database with a user."""
-    from infra.repositories import SQLAlchemyUserRepository
-    
-    user_repo = SQLAlchemyUserRepository(test_db.database)
-    created_user = await user_repo.create(sample_user)
-    return created_user
+    insert_users(test_db, sample_user)
+    return sample_user
 
 
-@pytest_asyncio.fixture
-async def db_with_study_book(test_db: DatabaseConfig, sample_user: User, sample_study_book: StudyBook) -> StudyBook:
+@pytest.fixture(scope="session")
+def db_with_user_readonly(test_db: DatabaseConfig) -> User:
+    """Create one user for the whole session, for tests that never modify it."""
+    insert_users(test_db, READONLY_USER)
+    return READONLY_USER
+
+
+@pytest.fixture
+def two_users(test_db: DatabaseConfig, clean_db: None, sample_user: User, sample_user_2: User) -> List[User]:
+    """Create two users with one insert."""
+    insert_users(test_db, sample_user, sample_user_2)
+    return [sample_user, sample_user_2]
+
+
+def bulk_create(session: Session, *models) -> None:
+    """Add model instances and commit them in a single flush."""
+    session.add_all(models)
+    session.commit()
+
+
+def _user_row(user: User) -> dict:
+    """Build the column values of the database row for a domain user."""
+    return {
+        "id": str(user.id),
+        "name": user.name,
+        "email": user.email.lower(),
+        "created_at": user.created_at.isoformat() + 'Z',
+        "updated_at": user.updated_at.isoformat() + 'Z'
+    }
+
+
+def _user_model(user: User) -> UserModel:
+    """Build the database row for a domain user."""
+    return UserModel(**_user_row(user))
+
+
+def _study_book_model(study_book: StudyBook) -> StudyBookModel:
+    """Build the database row for a domain study book."""
+    return StudyBookModel(
+        id=str(study_book.id),
+        user_id=str(study_book.user_id),
+        title=study_book.title,
+        description=study_book.description,
+        created_at=study_book.created_at.isoformat() + 'Z',
+        updated_at=study_book.updated_at.isoformat() + 'Z'
+    )
+
+
+def _question_model(question: Question) -> QuestionModel:
+    """Build the database row for a domain question."""
+    return QuestionModel(
+        id=str(question.id),
+        study_book_id=str(question.study_book_id),
+        language=question.language,
+        category=question.category,
+        difficulty=question.difficulty,
+        question=question.question,
+        answer=question.answer,
+        created_at=question.created_at.isoformat() + 'Z',
+        updated_at=question.updated_at.isoformat() + 'Z'
+    )
+
+
+@pytest.fixture
+def db_with_study_book(db_session: Session, sample_user: User, sample_study_book: StudyBook) -> StudyBook:
     """Create a test database with a user and study book."""
-    from infra.repositories import SQLAlchemyUserRepository, SQLAlchemyStudyBookRepository
-    
-    # Create user first
-    user_repo = SQLAlchemyUserRepository(test_db.database)
-    await user_repo.create(sample_user)
-    
-    # Create study book
-    study_book_repo = SQLAlchemyStudyBookRepository(test_db.database)
-    created_study_book = await study_book_repo.create(sample_study_book)
-    return created_study_book
+    bulk_create(db_session, _user_model(sample_user), _study_book_model(sample_study_book))
+    return sample_study_book
 
 
-@pytest_asyncio.fixture
-async def db_with_question(
-    test_db: DatabaseConfig, 
+@pytest.fixture
+def db_with_question(
+    db_session: Session, 
     sample_user: User, 
     sample_study_book: StudyBook, 
     sample_question: Question
 ) -> Question:
     """Create a test database with a user, study book, and question."""
-    from infra.repositories import (
-        SQLAlchemyUserRepository, 
-        SQLAlchemyStudyBookRepository, 
-        SQLAlchemyQuestionRepository
+    bulk_create(
+        db_session,
+        _user_model(sample_user),
+        _study_book_model(sample_study_book),
+        _question_model(sample_question)
     )
-    
-    # Create user
-    user_repo = SQLAlchemyUserRepository(test_db.database)
-    await user_repo.create(sample_user)
-    
-    # Create study book
-    study_book_repo = SQLAlchemyStudyBookRepository(test_db.database)
-    await study_book_repo.create(sample_study_book)
-    
-    # Create question
-    question_repo = SQLAlchemyQuestionRepository(test_db.database)
-    created_question = await question_repo.create(sample_question)
-    return created_question
+    return sample_question
 
 
 # Authentication helper fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers(sample_user: User) -> dict:
     """Create authentication headers for testing."""
     return {"X-User-Id": str(sample_user.id)}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def readonly_auth_headers(db_with_user_readonly: User) -> dict:
+    """Create authentication headers for the session's read-only user."""
+    return {"X-User-Id": str(db_with_user_readonly.id)}
+
+
+@pytest.fixture(scope="session")
 def auth_headers_2(sample_user_2: User) -> dict:
     """Create authentication headers for second user."""
     return {"X-User-Id": str(sample_user_2.id)}
@@ -4,6 +4,9 @@ Integration tests for search functionality.
 Tests full-text search with database integration and user scoping.
 """
 
+import base64
+from typing import List
+
 import pytest
 from httpx import AsyncClient
 from fastapi import status
@@ -35,21 +38,17 @@ class TestSearchEndpoints:
         assert isinstance(data["total_count"], int)
     
     @pytest.mark.asyncio
-    async def test_search_questions_with_results(self, async_test_client: AsyncClient, sample_user: User):
+    async def test_search_questions_with_results(self, async_test_client: AsyncClient, db_with_user: User):
         """Test search returns relevant results."""
-        headers = {"X-User-Id": str(sample_user.id)}
-        
-        # First create a user and study book
-        await async_test_client.post("/api/v1/users", json={
-            "name": sample_user.name,
-            "email": sample_user.email
-        })
+        headers = {"X-User-Id": str(db_with_user.id)}
         
+        # First create a study book
         study_book_response = await async_test_client.post(
-            "/api/v1/study-books",
+            "/api/v1/study-books/",
             json={"title": "Python Basics"},
             headers=headers
         )
+        assert study_book_response.status_code == status.HTTP_201_CREATED
         study_book_id = study_book_response.json()["id"]
         
         # Create questions with searchable content
@@ -70,12 +69,12 @@ class TestSearchEndpoints:
             }
         ]
         
-        for question_data in questions:
-            await async_test_client.post(
-                f"/api/v1/study-books/{study_book_id}/questions",
-                json=question_data,
-                headers=headers
-            )
+        bulk_response = await async_test_client.post(
+            f"/api/v1/questions/bulk?study_book_id={study_book_id}",
+            json=questions,
+            headers=headers
+        )
+        assert bulk_response.status_code == status.HTTP_201_CREATED
         
         # Search for "variable"
         response = await async_test_client.get(
@@ -129,40 +128,51 @@ class TestSearchEndpoints:
             headers=headers
         )
         
-        # Should return 400 for empty query or handle gracefully
-        assert response.status_code in [status.HTTP_400_BAD_REQUEST, status.HTTP_200_OK]
+        # Rejected by query validation before the handler runs
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     
     @pytest.mark.asyncio
-    async def test_search_questions_with_limit(self, async_test_client: AsyncClient, sample_user: User):
-        """Test search with custom limit parameter."""
-        headers = {"X-User-Id": str(sample_user.id)}
+    async def test_search_questions_blank_query(self, async_test_client: AsyncClient, db_with_user: User):
+        """Test search with a whitespace-only query."""
+        headers = {"X-User-Id": str(db_with_user.id)}
         
-        # Create user and study book with multiple questions
-        await async_test_client.post("/api/v1/users", json={
-            "name": sample_user.name,
-            "email": sample_user.email
-        })
+        response = await async_test_client.get(
+            "/api/v1/search/questions?q=%20%20",
+            headers=headers
+        )
         
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    
+    @pytest.mark.asyncio
+    async def test_search_questions_with_limit(self, async_test_client: AsyncClient, db_with_user: User):
+        """Test search with custom limit parameter."""
+        headers = {"X-User-Id": str(db_with_user.id)}
+        
+        # Create a study book with multiple questions
         study_book_response = await async_test_client.post(
-            "/api/v1/study-books",
+            "/api/v1/study-books/",
             json={"title": "Python Basics"},
             headers=headers
         )
+        assert study_book_response.status_code == status.HTTP_201_CREATED
         study_book_id = study_book_response.json()["id"]
         
         # Create multiple questions with "Python" in them
-        for i in range(5):
-            await async_test_client.post(
-                f"/api/v1/study-books/{study_book_id}/questions",
-                json={
+        bulk_response = await async_test_client.post(
+            f"/api/v1/questions/bulk?study_book_id={study_book_id}",
+            json=[
+                {
                     "language": "Python",
                     "category": "Basics",
                     "difficulty": "easy",
                     "question": f"Python question {i}?",
                     "answer": f"Python answer {i}."
-                },
-                headers=headers
-            )
+                }
+                for i in range(5)
+            ],
+            headers=headers
+        )
+        assert bulk_response.status_code == status.HTTP_201_CREATED
         
         # Search with limit
         response = await async_test_client.get(
@@ -174,6 +184,114 @@ class TestSearchEndpoints:
         
         data = response.json()
         assert len(data["results"]) <= 3
+        assert data["total_count"] >= len(data["results"])
+    
+    @pytest.mark.asyncio
+    async def test_search_questions_pagination(self, async_test_client: AsyncClient, db_with_user: User):
+        """Test paging through search results with next_cursor."""
+        headers = {"X-User-Id": str(db_with_user.id)}
+        
+        study_book_response = await async_test_client.post(
+            "/api/v1/study-books/",
+            json={"title": "Python Basics"},
+            headers=headers
+        )
+        assert study_book_response.status_code == status.HTTP_201_CREATED
+        study_book_id = study_book_response.json()["id"]
+        
+        bulk_response = await async_test_client.post(
+            f"/api/v1/questions/bulk?study_book_id={study_book_id}",
+            json=[
+                {
+                    "language": "Python",
+                    "category": "Basics",
+                    "difficulty": "easy",
+                    "question": f"Python question {i}?",
+                    "answer": f"Python answer {i}."
+                }
+                for i in range(5)
+            ],
+            headers=headers
+        )
+        assert bulk_response.status_code == status.HTTP_201_CREATED
+        
+        # Follow next_cursor until the results run out
+        seen_ids = []
+        url = "/api/v1/search/questions?q=Python&limit=2"
+        cursor = None
+        for _ in range(5):
+            response = await async_test_client.get(
+                url + (f"&cursor={cursor}" if cursor else ""),
+                headers=headers
+            )
+            assert response.status_code == status.HTTP_200_OK
+            
+            data = response.json()
+            assert data["total_count"] == 5
+            seen_ids.extend(result["question_id"] for result in data["results"])
+            
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+        
+        assert len(seen_ids) == 5
+        assert len(set(seen_ids)) == 5
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        base64.urlsafe_b64encode(b"[1, 5]").decode(),
+        base64.urlsafe_b64encode(b'{"rank": 1}').decode(),
+    ], ids=["not_base64", "non_string_id", "not_a_pair"])
+    async def test_search_questions_invalid_cursor(self, async_test_client: AsyncClient, db_with_user: User, cursor: str):
+        """Test search with a malformed cursor."""
+        headers = {"X-User-Id": str(db_with_user.id)}
+        
+        response = await async_test_client.get(
+            f"/api/v1/search/questions?q=Python&cursor={cursor}",
+            headers=headers
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    @pytest.mark.asyncio
+    async def test_search_questions_after_bulk_create(self, async_test_client: AsyncClient, db_with_user: User):
+        """Test a repeated search sees questions added since it was cached."""
+        headers = {"X-User-Id": str(db_with_user.id)}
+        
+        study_book_response = await async_test_client.post(
+            "/api/v1/study-books/",
+            json={"title": "Python Basics"},
+            headers=headers
+        )
+        assert study_book_response.status_code == status.HTTP_201_CREATED
+        study_book_id = study_book_response.json()["id"]
+        
+        # The first search caches an empty first page
+        response = await async_test_client.get("/api/v1/search/questions?q=decorator", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total_count"] == 0
+        
+        bulk_response = await async_test_client.post(
+            f"/api/v1/questions/bulk?study_book_id={study_book_id}",
+            json=[{
+                "language": "Python",
+                "category": "Functions",
+                "difficulty": "medium",
+                "question": "What is a decorator?",
+                "answer": "A function that wraps another function."
+            }],
+            headers=headers
+        )
+        assert bulk_response.status_code == status.HTTP_201_CREATED
+        
+        # The same search must not be served from the stale cache entry
+        response = await async_test_client.get("/api/v1/search/questions?q=decorator", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        
+        data = response.json()
+        assert data["total_count"] == 1
+        assert data["results"][0]["question_id"] == bulk_response.json()[0]["id"]
     
     @pytest.mark.asyncio
     async def test_search_questions_no_auth(self, async_test_client: AsyncClient):
@@ -371,4 +489,40 @@ class TestSearchUserScoping:
         
         # User 2 should not find User 1's content
         assert data["total_count"] == 0
-        assert data["results"] == []
\ No newline at end of file
+        assert data["results"] == []
+    
+    @pytest.mark.asyncio
+    async def test_bulk_create_questions_in_other_users_study_book(
+        self, async_test_client: AsyncClient, two_users: List[User]
+    ):
+        """Test that bulk-creating questions in another user's study book returns 404."""
+        headers1 = {"X-User-Id": str(two_users[0].id)}
+        headers2 = {"X-User-Id": str(two_users[1].id)}
+        
+        study_book_response = await async_test_client.post(
+            "/api/v1/study-books/",
+            json={"title": "User 1 Book"},
+            headers=headers1
+        )
+        assert study_book_response.status_code == status.HTTP_201_CREATED
+        study_book_id = study_book_response.json()["id"]
+        
+        # User 2 tries to add questions to User 1's study book
+        response = await async_test_client.post(
+            f"/api/v1/questions/bulk?study_book_id={study_book_id}",
+            json=[{
+                "language": "Python",
+                "category": "Test",
+                "difficulty": "easy",
+                "question": "Injected question?",
+                "answer": "Injected answer."
+            }],
+            headers=headers2
+        )
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        
+        # Nothing was added to User 1's study book
+        search_response = await async_test_client.get("/api/v1/search/questions?q=Injected", headers=headers1)
+        assert search_response.status_code == status.HTTP_200_OK
+        assert search_response.json()["total_count"] == 0
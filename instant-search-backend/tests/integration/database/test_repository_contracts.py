@@ -5,11 +5,15 @@ Tests that repository implementations correctly implement the repository interfa
 using real database connections.
 """
 
+import inspect
 import pytest
 import asyncio
 from uuid import uuid4
 from datetime import datetime
 
+from sqlalchemy import inspect as inspect_database, text
+from sqlalchemy.orm import Session
+
 from infra.repositories import (
     SQLAlchemyUserRepository,
     SQLAlchemyStudyBookRepository,
@@ -20,65 +24,46 @@ from infra.repositories import (
 from domain.models import User, StudyBook, Question, TypingLog, LearningEvent
 from domain.exceptions import UserNotFoundError, StudyBookNotFoundError
 
+# Compiled once and reused by every connection check
+_SELECT_1 = text("SELECT 1 as test_value")
+
 
 class TestRepositoryBasicFunctionality:
     """Test basic repository functionality to ensure they work with the database."""
     
-    def test_repository_instantiation(self, test_db):
+    def test_repository_instantiation(self, db_connection):
         """Test that repositories can be instantiated with a database session."""
-        session = test_db.get_session()
-        try:
-            # Test that all repositories can be created
-            user_repo = SQLAlchemyUserRepository(session)
-            study_book_repo = SQLAlchemyStudyBookRepository(session)
-            question_repo = SQLAlchemyQuestionRepository(session)
-            typing_log_repo = SQLAlchemyTypingLogRepository(session)
-            learning_event_repo = SQLAlchemyLearningEventRepository(session)
-            
-            # Verify they are the correct types
-            assert isinstance(user_repo, SQLAlchemyUserRepository)
-            assert isinstance(study_book_repo, SQLAlchemyStudyBookRepository)
-            assert isinstance(question_repo, SQLAlchemyQuestionRepository)
-            assert isinstance(typing_log_repo, SQLAlchemyTypingLogRepository)
-            assert isinstance(learning_event_repo, SQLAlchemyLearningEventRepository)
-            
-        finally:
-            session.close()
+        session = Session(bind=db_connection)
+        
+        # Test that all repositories can be created
+        user_repo = SQLAlchemyUserRepository(session)
+        study_book_repo = SQLAlchemyStudyBookRepository(session)
+        question_repo = SQLAlchemyQuestionRepository(session)
+        typing_log_repo = SQLAlchemyTypingLogRepository(session)
+        learning_event_repo = SQLAlchemyLearningEventRepository(session)
+        
+        # Verify they are the correct types
+        assert isinstance(user_repo, SQLAlchemyUserRepository)
+        assert isinstance(study_book_repo, SQLAlchemyStudyBookRepository)
+        assert isinstance(question_repo, SQLAlchemyQuestionRepository)
+        assert isinstance(typing_log_repo, SQLAlchemyTypingLogRepository)
+        assert isinstance(learning_event_repo, SQLAlchemyLearningEventRepository)
     
-    def test_database_tables_exist(self, test_db):
+    def test_database_tables_exist(self, db_connection):
         """Test that database tables are created properly."""
-        session = test_db.get_session()
-        try:
-            # Test that we can query the tables (even if empty)
-            from infra.database import UserModel, StudyBookModel, QuestionModel, TypingLogModel, LearningEventModel
-            
-            # These should not raise exceptions
-            user_count = session.query(UserModel).count()
-            study_book_count = session.query(StudyBookModel).count()
-            question_count = session.query(QuestionModel).count()
-            typing_log_count = session.query(TypingLogModel).count()
-            learning_event_count = session.query(LearningEventModel).count()
-            
-            # All should be 0 for a fresh database
-            assert user_count == 0
-            assert study_book_count == 0
-            assert question_count == 0
-            assert typing_log_count == 0
-            assert learning_event_count == 0
-            
-        finally:
-            session.close()
+        from infra.database import UserModel, StudyBookModel, QuestionModel, TypingLogModel, LearningEventModel
+        
+        # One catalog lookup confirms every table exists
+        expected_tables = {
+            model.__tablename__
+            for model in (UserModel, StudyBookModel, QuestionModel, TypingLogModel, LearningEventModel)
+        }
+        assert expected_tables <= set(inspect_database(db_connection).get_table_names())
     
-    def test_database_connection_works(self, test_db):
+    def test_database_connection_works(self, db_connection):
         """Test that the database connection and basic operations work."""
-        session = test_db.get_session()
-        try:
-            # Test basic SQL execution
-            result = session.execute("SELECT 1 as test_value").fetchone()
-            assert result[0] == 1
-            
-        finally:
-            session.close()
+        # Test basic SQL execution
+        assert db_connection.execute(_SELECT_1).scalar() == 1
 
 
 class TestRepositoryInterfaceCompliance:
@@ -91,29 +76,33 @@ class TestRepositoryInterfaceCompliance:
             TypingLogRepository, LearningEventRepository
         )
         
-        # Test inheritance
-        assert issubclass(SQLAlchemyUserRepository, UserRepository)
-        assert issubclass(SQLAlchemyStudyBookRepository, StudyBookRepository)
-        assert issubclass(SQLAlchemyQuestionRepository, QuestionRepository)
-        assert issubclass(SQLAlchemyTypingLogRepository, TypingLogRepository)
-        assert issubclass(SQLAlchemyLearningEventRepository, LearningEventRepository)
+        implementations = {
+            SQLAlchemyUserRepository: UserRepository,
+            SQLAlchemyStudyBookRepository: StudyBookRepository,
+            SQLAlchemyQuestionRepository: QuestionRepository,
+            SQLAlchemyTypingLogRepository: TypingLogRepository,
+            SQLAlchemyLearningEventRepository: LearningEventRepository,
+        }
+        
+        for implementation, interface in implementations.items():
+            # Test inheritance, and that no abstract method is left unimplemented
+            assert issubclass(implementation, interface)
+            assert not implementation.__abstractmethods__, (
+                f"{implementation.__name__} does not implement "
+                f"{sorted(implementation.__abstractmethods__)}"
+            )
     
-    def test_repository_methods_exist(self):
+    @pytest.mark.parametrize("repository_class,required_methods", [
+        (SQLAlchemyUserRepository,
+         {'create', 'get_by_id', 'get_by_email', 'update', 'delete'}),
+        (SQLAlchemyStudyBookRepository,
+         {'create', 'get_by_id', 'get_by_user_id', 'update', 'delete', 'count_by_user_id'}),
+        (SQLAlchemyQuestionRepository,
+         {'create', 'get_by_id', 'get_by_study_book_id', 'get_random_by_study_book_id',
+          'update', 'delete', 'count_by_study_book_id'}),
+    ])
+    def test_repository_methods_exist(self, repository_class, required_methods):
         """Test that repository implementations have the required methods."""
-        # Test UserRepository methods
-        user_repo_methods = ['create', 'get_by_id', 'get_by_email', 'update', 'delete']
-        for method_name in user_repo_methods:
-            assert hasattr(SQLAlchemyUserRepository, method_name)
-            assert callable(getattr(SQLAlchemyUserRepository, method_name))
-        
-        # Test StudyBookRepository methods
-        study_book_repo_methods = ['create', 'get_by_id', 'get_by_user_id', 'update', 'delete', 'count_by_user_id']
-        for method_name in study_book_repo_methods:
-            assert hasattr(SQLAlchemyStudyBookRepository, method_name)
-            assert callable(getattr(SQLAlchemyStudyBookRepository, method_name))
-        
-        # Test QuestionRepository methods
-        question_repo_methods = ['create', 'get_by_id', 'get_by_study_book_id', 'get_random_by_study_book_id', 'update', 'delete', 'count_by_study_book_id']
-        for method_name in question_repo_methods:
-            assert hasattr(SQLAlchemyQuestionRepository, method_name)
-            assert callable(getattr(SQLAlchemyQuestionRepository, method_name))
\ No newline at end of file
+        methods = {name for name, member in inspect.getmembers(repository_class) if callable(member)}
+        missing = required_methods - methods
+        assert not missing, f"{repository_class.__name__} is missing {sorted(missing)}"
\ No newline at end of file
@@ -27,11 +27,11 @@ class TestCachePerformance:
         await cached_service.get_available_languages()
         
         # Measure response time
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         languages = await cached_service.get_available_languages()
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
         
-        response_time_ms = (end_time - start_time) * 1000
+        response_time_ms = (end_time - start_time) / 1e6
         
         assert response_time_ms < 100, f"Languages response time {response_time_ms:.2f}ms exceeds 100ms requirement"
         assert len(languages) > 0, "Should return available languages"
@@ -43,11 +43,11 @@ class TestCachePerformance:
         await cached_service.get_problems_by_language("javascript")
         
         # Measure response time
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         problems = await cached_service.get_problems_by_language("javascript")
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
         
-        response_time_ms = (end_time - start_time) * 1000
+        response_time_ms = (end_time - start_time) / 1e6
         
         assert response_time_ms < 500, f"System problems response time {response_time_ms:.2f}ms exceeds 500ms requirement"
         assert len(problems) > 0, "Should return problems for JavaScript"
@@ -59,23 +59,23 @@ class TestCachePerformance:
         iterations = 100
         
         # Test default service performance
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         for _ in range(iterations):
             await default_service.get_available_languages()
-        default_time = time.time() - start_time
+        default_time = time.perf_counter_ns() - start_time
         
         # Warm up cache
         await cached_service.get_available_languages()
         
         # Test cached service performance
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         for _ in range(iterations):
             await cached_service.get_available_languages()
-        cached_time = time.time() - start_time
+        cached_time = time.perf_counter_ns() - start_time
         
         # Cached should be significantly faster
         improvement_ratio = default_time / cached_time if cached_time > 0 else float('inf')
-        assert improvement_ratio > 2, f"Cached service should be at least 2x faster. Default: {default_time*1000:.2f}ms, Cached: {cached_time*1000:.2f}ms, Ratio: {improvement_ratio:.2f}x"
+        assert improvement_ratio > 2, f"Cached service should be at least 2x faster. Default: {default_time / 1e6:.2f}ms, Cached: {cached_time / 1e6:.2f}ms, Ratio: {improvement_ratio:.2f}x"
 
     @pytest.mark.asyncio
     async def test_repeated_calls_performance(self, cached_service):
@@ -87,16 +87,16 @@ class TestCachePerformance:
         await cached_service.clear_cache()
         
         # First batch of calls (cache miss + population)
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         for _ in range(iterations):
             problems1 = await cached_service.get_problems_by_language(language)
-        first_batch_time = time.time() - start_time
+        first_batch_time = time.perf_counter_ns() - start_time
         
         # Second batch of calls (cache hits)
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         for _ in range(iterations):
             problems2 = await cached_service.get_problems_by_language(language)
-        second_batch_time = time.time() - start_time
+        second_batch_time = time.perf_counter_ns() - start_time
         
         # Results should be identical
         assert problems1 == problems2, "Cached results should be identical"
@@ -104,7 +104,7 @@ class TestCachePerformance:
         # Second batch should be faster
         if second_batch_time > 0:
             improvement_ratio = first_batch_time / second_batch_time
-            assert improvement_ratio > 1.5, f"Second batch should be faster. First: {first_batch_time*1000:.2f}ms, Second: {second_batch_time*1000:.2f}ms, Ratio: {improvement_ratio:.2f}x"
+            assert improvement_ratio > 1.5, f"Second batch should be faster. First: {first_batch_time / 1e6:.2f}ms, Second: {second_batch_time / 1e6:.2f}ms, Ratio: {improvement_ratio:.2f}x"
 
     @pytest.mark.asyncio
     async def test_concurrent_access_performance(self, cached_service):
@@ -120,7 +120,7 @@ class TestCachePerformance:
         await get_problems("javascript")
         
         # Test concurrent access
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         tasks = []
         for _ in range(10):
@@ -130,8 +130,8 @@ class TestCachePerformance:
         
         results = await asyncio.gather(*tasks)
         
-        end_time = time.time()
-        total_time_ms = (end_time - start_time) * 1000
+        end_time = time.perf_counter_ns()
+        total_time_ms = (end_time - start_time) / 1e6
         
         # All concurrent calls should complete quickly
         assert total_time_ms < 100, f"Concurrent access took {total_time_ms:.2f}ms, should be under 100ms"
@@ -182,9 +182,9 @@ class TestCachePerformance:
         assert info["languages_cached"] > 0
         
         # Test that warmed cache provides fast access
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         languages = await cached_service.get_available_languages()
-        response_time_ms = (time.time() - start_time) * 1000
+        response_time_ms = (time.perf_counter_ns() - start_time) / 1e6
         
         assert response_time_ms < 50, f"Warmed cache should respond very quickly, got {response_time_ms:.2f}ms"
         assert len(languages) > 0
@@ -225,11 +225,11 @@ class TestCachePerformance:
                 tasks.append(cached_service.get_available_languages())
                 tasks.append(cached_service.get_problems_by_language("javascript"))
             
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             results = await asyncio.gather(*tasks)
-            end_time = time.time()
+            end_time = time.perf_counter_ns()
             
-            return results, (end_time - start_time) * 1000
+            return results, (end_time - start_time) / 1e6
         
         results, total_time_ms = await make_requests()
         
@@ -261,32 +261,29 @@ class TestCachePerformance:
         info = cached_service.get_cache_info()
         
         # Should have good hit ratios
-        if "lru_languages_cache" in info:
-            lang_cache = info["lru_languages_cache"]
-            if lang_cache["hits"] + lang_cache["misses"] > 0:
-                hit_ratio = lang_cache["hits"] / (lang_cache["hits"] + lang_cache["misses"])
-                assert hit_ratio > 0.8, f"Language cache hit ratio {hit_ratio:.2f} should be > 0.8"
+        hit_ratio = info["hits"] / (info["hits"] + info["misses"])
+        assert hit_ratio > 0.8, f"Problems cache hit ratio {hit_ratio:.2f} should be > 0.8"
 
     @pytest.mark.asyncio
     async def test_performance_regression_detection(self, cached_service, default_service):
         """Test for performance regressions by comparing with baseline."""
         # Test default service performance (baseline)
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         for _ in range(5):
             await default_service.get_available_languages()
-        default_time = time.time() - start_time
+        default_time = time.perf_counter_ns() - start_time
         
         # Test cached service performance (should be better)
         await cached_service.warm_cache()
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         for _ in range(5):
             await cached_service.get_available_languages()
-        cached_time = time.time() - start_time
+        cached_time = time.perf_counter_ns() - start_time
         
         # Cached should be significantly faster
         if cached_time > 0:
             improvement = default_time / cached_time
-            assert improvement > 1.5, f"Cached service should be faster. Default: {default_time*1000:.2f}ms, Cached: {cached_time*1000:.2f}ms"
+            assert improvement > 1.5, f"Cached service should be faster. Default: {default_time / 1e6:.2f}ms, Cached: {cached_time / 1e6:.2f}ms"
 
     @pytest.mark.asyncio
     async def test_scalability_with_multiple_languages(self, cached_service):
@@ -295,7 +292,7 @@ class TestCachePerformance:
         languages = await cached_service.get_available_languages()
         
         # Test accessing problems for all languages
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         tasks = []
         for language in languages:
@@ -303,7 +300,7 @@ class TestCachePerformance:
         
         results = await asyncio.gather(*tasks)
         
-        total_time_ms = (time.time() - start_time) * 1000
+        total_time_ms = (time.perf_counter_ns() - start_time) / 1e6
         
         # Should handle all languages efficiently
         avg_time_per_language = total_time_ms / len(languages)
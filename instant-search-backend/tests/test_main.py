@@ -2,14 +2,11 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
 
-
-def test_root_endpoint():
+def test_root_endpoint(test_client: TestClient):
     """Test the root endpoint returns expected response."""
-    response = client.get("/")
+    response = test_client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert "message" in data
@@ -17,7 +14,7 @@ def test_root_endpoint():
     assert data["version"] == "1.0.0"
 
 
-def test_docs_endpoint():
+def test_docs_endpoint(test_client: TestClient):
     """Test that API documentation is available."""
-    response = client.get("/docs")
+    response = test_client.get("/docs")
     assert response.status_code == 200
\ No newline at end of file
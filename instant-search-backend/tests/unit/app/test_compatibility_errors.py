@@ -15,6 +15,18 @@ from fastapi.responses import JSONResponse
 from app.compatibility_errors import CompatibilityErrorHandler, CompatibilityLogger
 
 
+@pytest.fixture
+def mock_request():
+    """Create a mock request carrying the state the error handler logs."""
+    request = Mock(spec=Request)
+    request.state.trace_id = "test-trace-id"
+    request.state.user_id = "test-user-id"
+    request.url = Mock()
+    request.url.__str__ = Mock(return_value="http://test.com/api/v1/studybooks/languages")
+    request.method = "GET"
+    return request
+
+
 class TestCompatibilityErrorHandler:
     """Test compatibility error handler."""
     
@@ -26,16 +38,8 @@ class TestCompatibilityErrorHandler:
         assert len(result) == 0
     
     @patch('app.compatibility_errors.logger')
-    def test_handle_service_error(self, mock_logger):
+    def test_handle_service_error(self, mock_logger, mock_request):
         """Test service error handling."""
-        # Create mock request
-        mock_request = Mock(spec=Request)
-        mock_request.state.trace_id = "test-trace-id"
-        mock_request.state.user_id = "test-user-id"
-        mock_request.url = Mock()
-        mock_request.url.__str__ = Mock(return_value="http://test.com/api/v1/studybooks/languages")
-        mock_request.method = "GET"
-        
         # Create test exception
         test_error = Exception("Database connection failed")
         
@@ -62,14 +66,11 @@ class TestCompatibilityLogger:
     """Test compatibility logger."""
     
     @patch('app.compatibility_errors.logger')
-    def test_log_endpoint_access(self, mock_logger):
+    def test_log_endpoint_access(self, mock_logger, mock_request):
         """Test endpoint access logging."""
         user_id = uuid4()
         trace_id = "test-trace-id"
         
-        # Create mock request
-        mock_request = Mock(spec=Request)
-        
         CompatibilityLogger.log_endpoint_access(
             "languages",
             user_id,
@@ -148,16 +149,8 @@ class TestCompatibilityIntegration:
     """Integration tests for compatibility error handling."""
     
     @patch('app.compatibility_errors.logger')
-    async def test_error_handling_flow(self, mock_logger):
+    async def test_error_handling_flow(self, mock_logger, mock_request):
         """Test complete error handling flow."""
-        # Create mock request
-        mock_request = Mock(spec=Request)
-        mock_request.state.trace_id = "integration-trace-id"
-        mock_request.state.user_id = "integration-user-id"
-        mock_request.url = Mock()
-        mock_request.url.__str__ = Mock(return_value="http://test.com/api/v1/studybooks/system-problems/python")
-        mock_request.method = "GET"
-        
         # Simulate service error
         service_error = Exception("Database timeout")
         
@@ -180,4 +173,4 @@ class TestCompatibilityIntegration:
         content = response.body.decode()
         assert "ServiceError" in content
         assert "Unable to retrieve system problems" in content
-        assert "integration-trace-id" in content
\ No newline at end of file
+        assert "test-trace-id" in content
\ No newline at end of file
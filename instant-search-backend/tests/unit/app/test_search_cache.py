@@ -0,0 +1,100 @@
+"""
+Tests for the search result cache.
+
+This module tests cache hits, per-user invalidation and key normalization
+for the in-process search result cache.
+"""
+
+from uuid import uuid4
+
+from app.search_cache import SearchResultCache
+from domain.dtos import SearchResult
+
+
+def _result() -> SearchResult:
+    return SearchResult(
+        question_id=uuid4(),
+        question="What is a variable?",
+        answer="A named storage location.",
+        highlight="What is a <mark>variable</mark>?",
+        score=0.5
+    )
+
+
+class TestSearchResultCache:
+    """Test search result cache."""
+    
+    def test_miss_then_hit(self):
+        """Test cached results are returned for the same search."""
+        cache = SearchResultCache()
+        user_id = uuid4()
+        results = [_result()]
+        
+        assert cache.get(cache.key(user_id, "variable", 50)) is None
+        
+        cache.set(cache.key(user_id, "variable", 50), results)
+        
+        assert cache.get(cache.key(user_id, "variable", 50)) == results
+    
+    def test_query_is_case_insensitive(self):
+        """Test searches differing only in case share an entry."""
+        cache = SearchResultCache()
+        user_id = uuid4()
+        results = [_result()]
+        
+        cache.set(cache.key(user_id, "Variable", 50), results)
+        
+        assert cache.get(cache.key(user_id, "variable", 50)) == results
+    
+    def test_limit_is_part_of_key(self):
+        """Test searches with different limits are cached separately."""
+        cache = SearchResultCache()
+        user_id = uuid4()
+        
+        cache.set(cache.key(user_id, "variable", 50), [_result()])
+        
+        assert cache.get(cache.key(user_id, "variable", 3)) is None
+    
+    def test_invalidate_user(self):
+        """Test invalidation only drops the given user's searches."""
+        cache = SearchResultCache()
+        user_id = uuid4()
+        other_user_id = uuid4()
+        results = [_result()]
+        
+        cache.set(cache.key(user_id, "variable", 50), results)
+        cache.set(cache.key(other_user_id, "variable", 50), results)
+        cache.invalidate_user(user_id)
+        
+        assert cache.get(cache.key(user_id, "variable", 50)) is None
+        assert cache.get(cache.key(other_user_id, "variable", 50)) == results
+    
+    def test_entries_expire(self):
+        """Test entries are dropped after the TTL."""
+        cache = SearchResultCache(ttl=0)
+        user_id = uuid4()
+        
+        cache.set(cache.key(user_id, "variable", 50), [_result()])
+        
+        assert cache.get(cache.key(user_id, "variable", 50)) is None
+    
+    def test_invalidate_during_search(self):
+        """Test results of a search overlapping a write are not cached."""
+        cache = SearchResultCache()
+        user_id = uuid4()
+        
+        key = cache.key(user_id, "variable", 50)
+        assert cache.get(key) is None
+        cache.invalidate_user(user_id)
+        cache.set(key, [_result()])
+        
+        assert cache.get(cache.key(user_id, "variable", 50)) is None
+    
+    def test_generations_are_bounded(self):
+        """Test user generations are pruned along with the cached searches."""
+        cache = SearchResultCache(maxsize=2)
+        
+        for _ in range(10):
+            cache.key(uuid4(), "variable", 50)
+        
+        assert len(cache._generations) == 2
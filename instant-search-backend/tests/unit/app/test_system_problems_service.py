@@ -4,6 +4,8 @@ Unit tests for SystemProblemsService implementations.
 Tests the business logic and data handling of system problems services.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch
 from typing import List
@@ -183,6 +185,15 @@ class TestCachedSystemProblemsService:
         problems2 = await service.get_problems_by_language("javascript")
         assert problems == problems2
 
+    @pytest.mark.asyncio
+    async def test_cached_problems_cannot_be_modified_by_callers(self, service):
+        """Test that changing a returned list leaves the cached problems intact."""
+        problems = await service.get_problems_by_language("javascript")
+        count = len(problems)
+        problems.clear()
+        
+        assert len(await service.get_problems_by_language("javascript")) == count
+
     @pytest.mark.asyncio
     async def test_cache_initialization(self, service):
         """Test cache initialization behavior."""
@@ -214,6 +225,23 @@ class TestCachedSystemProblemsService:
         assert info_after["problems_cached"] > 0
         assert info_after["languages_cached"] > 0
 
+    @pytest.mark.asyncio
+    async def test_cache_info_counts_hits_and_misses(self, service):
+        """Test that problem lookups are counted as hits or misses."""
+        await service.get_problems_by_language("javascript")
+        await service.get_problems_by_language("JavaScript")
+        await service.get_problems_by_language("unknown-language")
+        
+        info = service.get_cache_info()
+        assert info["hits"] == 2
+        assert info["misses"] == 1
+        
+        # Clearing the cache resets the counters
+        await service.clear_cache()
+        info_after = service.get_cache_info()
+        assert info_after["hits"] == 0
+        assert info_after["misses"] == 0
+
     @pytest.mark.asyncio
     async def test_cache_clear_functionality(self, service):
         """Test cache clearing."""
@@ -250,8 +278,6 @@ class TestCachedSystemProblemsService:
     @pytest.mark.asyncio
     async def test_concurrent_cache_access(self, service):
         """Test concurrent access to cached service."""
-        import asyncio
-        
         # Create multiple concurrent tasks
         tasks = [
             service.get_available_languages(),
@@ -272,8 +298,6 @@ class TestCachedSystemProblemsService:
     @pytest.mark.asyncio
     async def test_cache_thread_safety(self, service):
         """Test cache thread safety with concurrent initialization."""
-        import asyncio
-        
         # Clear cache to test concurrent initialization
         await service.clear_cache()
         